@@ -0,0 +1,20 @@
+"""
+config_cache.py - Cached configuration loading
+Parses config.json once per mtime so repeat lookups skip disk and JSON work.
+"""
+import json
+import os
+from functools import lru_cache
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'config.json')
+
+
+@lru_cache(maxsize=1)
+def _load_config(mtime: float):
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def get_config():
+    """Return the parsed config, re-reading only when the file changes."""
+    return _load_config(os.path.getmtime(CONFIG_PATH))
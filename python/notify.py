@@ -4,6 +4,7 @@ Sends a summary notification after workflow execution (prints to console, can be
 """
 import os
 import json
+import mmap
 import datetime
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'config.json')
@@ -16,16 +17,19 @@ def send_notification():
     if not os.path.exists(SESSION_SUMMARY):
         print("[Notify] No session summary found.")
         return
-    with open(SESSION_SUMMARY, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    # Find last session summary
-    last_idx = None
-    for i in range(len(lines)-1, -1, -1):
-        if lines[i].startswith('## Session Summary'):
-            last_idx = i
-            break
-    if last_idx is not None:
-        summary = ''.join(lines[last_idx:]).strip()
+    # Reverse byte search via mmap: reads only the final summary block
+    # instead of loading the whole (ever-growing) log into a list.
+    summary = None
+    with open(SESSION_SUMMARY, 'rb') as f:
+        size = os.path.getsize(SESSION_SUMMARY)
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                idx = mm.rfind(b'\n## Session Summary')
+                if idx >= 0:
+                    summary = mm[idx + 1:].decode('utf-8', errors='replace').strip()
+                elif mm[:18] == b'## Session Summary':
+                    summary = mm[:].decode('utf-8', errors='replace').strip()
+    if summary is not None:
         print(f"[Notify] Last session summary:\n{summary}")
     else:
         print("[Notify] No session summary found.")
@@ -1,7 +1,6 @@
 from typing import Any, Dict, List
 import sys
 import os
-import json
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tools'))
 from logging_utils import setup_logging
@@ -10,13 +9,13 @@ from qa import run_quality_assurance
 from task_manager import TaskManagerModule
 from session import write_session_summary, log_session_event
 from error_patterns import recognize_error_patterns
+from config_cache import get_config
 
 def is_running_under_pytest():
     return "pytest" in sys.modules or os.environ.get("PYTEST_CURRENT_TEST") is not None
 
-# Load configuration
-with open(os.path.join(os.path.dirname(__file__), 'config.json'), 'r', encoding='utf-8') as f:
-    config = json.load(f)
+# Load configuration (cached per mtime; repeat imports skip the disk read)
+config = get_config()
 
 logger = setup_logging(config.get('logfile', 'python_workflow.log'))
 
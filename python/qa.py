@@ -5,49 +5,70 @@ Handles code quality checks and test integration using real tools.
 import subprocess
 import os
 import sys
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Tuple
 
 def is_running_under_pytest():
     return "pytest" in sys.modules or os.environ.get("PYTEST_CURRENT_TEST") is not None
 
-def run_quality_assurance(codebase: str) -> Dict[str, Any]:
-    if is_running_under_pytest():
-        return {'all_passed': True, 'pytest_passed': True, 'flake8_passed': True, 'mypy_passed': True, 'skipped': 'Running under pytest, skipping QA subprocesses.'}
-    results: Dict[str, Any] = {}
-    base_dir = os.path.abspath(codebase)
+def _run_flake8(base_dir: str) -> Tuple[bool, str]:
     try:
-        flake8_proc = subprocess.run([
+        proc = subprocess.run([
             'flake8', base_dir
         ], capture_output=True, text=True, check=False, timeout=60)
-        results['flake8_passed'] = flake8_proc.returncode == 0
-        results['flake8_output'] = flake8_proc.stdout + flake8_proc.stderr
+        return proc.returncode == 0, proc.stdout + proc.stderr
     except Exception as e:
-        results['flake8_passed'] = False
-        results['flake8_output'] = f"Exception: {e}"
+        return False, f"Exception: {e}"
+
+def _run_mypy(base_dir: str) -> Tuple[bool, str]:
     try:
-        mypy_proc = subprocess.run([
+        proc = subprocess.run([
             'mypy', base_dir
         ], capture_output=True, text=True, check=False, timeout=60)
-        results['mypy_passed'] = mypy_proc.returncode == 0
-        results['mypy_output'] = mypy_proc.stdout + mypy_proc.stderr
+        return proc.returncode == 0, proc.stdout + proc.stderr
     except Exception as e:
-        results['mypy_passed'] = False
-        results['mypy_output'] = f"Exception: {e}"
+        return False, f"Exception: {e}"
+
+def _run_pytest_shard(shard: list) -> Tuple[bool, str]:
+    proc = subprocess.run([
+        'pytest', '-q', '--maxfail=5', '--disable-warnings', *shard
+    ], capture_output=True, text=True, check=False, timeout=120)
+    return proc.returncode == 0, proc.stdout + proc.stderr
+
+def _run_pytest(base_dir: str) -> Tuple[bool, str]:
     try:
         # Only run pytest on test_*.py files to avoid recursion
         test_files = [os.path.join(base_dir, f) for f in os.listdir(base_dir) if f.startswith('test_') and f.endswith('.py')] if os.path.isdir(base_dir) else [base_dir]
-        if test_files:
-            pytest_proc = subprocess.run([
-                'pytest', '-q', '--maxfail=5', '--disable-warnings', *test_files
-            ], capture_output=True, text=True, check=False, timeout=120)
-            results['pytest_passed'] = pytest_proc.returncode == 0
-            results['pytest_output'] = pytest_proc.stdout + pytest_proc.stderr
-        else:
-            results['pytest_passed'] = True
-            results['pytest_output'] = 'No test files found.'
+        if not test_files:
+            return True, 'No test files found.'
+        # Shard the suite across parallel pytest processes; each shard is an
+        # independent subprocess so threads are enough to drive them.
+        nshards = min(os.cpu_count() or 1, len(test_files), 4)
+        shards = [test_files[i::nshards] for i in range(nshards)]
+        with ThreadPoolExecutor(max_workers=nshards) as pool:
+            outcomes = list(pool.map(_run_pytest_shard, shards))
+        return all(ok for ok, _ in outcomes), '\n'.join(out for _, out in outcomes)
     except Exception as e:
-        results['pytest_passed'] = False
-        results['pytest_output'] = f"Exception: {e}"
+        return False, f"Exception: {e}"
+
+def run_quality_assurance(codebase: str) -> Dict[str, Any]:
+    if is_running_under_pytest():
+        return {'all_passed': True, 'pytest_passed': True, 'flake8_passed': True, 'mypy_passed': True, 'skipped': 'Running under pytest, skipping QA subprocesses.'}
+    results: Dict[str, Any] = {}
+    base_dir = os.path.abspath(codebase)
+    # The three tools are independent subprocesses; subprocess.run releases
+    # the GIL while waiting, so a thread pool turns sum-of-tool-times into
+    # max-of-tool-times.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = {
+            'flake8': pool.submit(_run_flake8, base_dir),
+            'mypy': pool.submit(_run_mypy, base_dir),
+            'pytest': pool.submit(_run_pytest, base_dir),
+        }
+        for tool, fut in futures.items():
+            passed, output = fut.result()
+            results[f'{tool}_passed'] = passed
+            results[f'{tool}_output'] = output
     results['syntax_validation'] = results.get('flake8_passed', False)
     results['style_compliance'] = results.get('flake8_passed', False)
     results['type_checking'] = results.get('mypy_passed', False)
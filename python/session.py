@@ -2,54 +2,99 @@
 session.py - Session Management and Logging
 Handles session summary writing and event logging.
 """
+import atexit
 import json
+import queue
+import threading
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import logging
 
-def write_session_summary(context: Dict[str, Any], accomplishments: Dict[str, Any], metrics: Dict[str, Any], learning: Dict[str, Any], logger: Optional[logging.Logger] = None) -> None:
-    timestamp = datetime.now().isoformat()
-    summary = f"""## Session Summary - {timestamp}
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode('utf-8')
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+# Background writer: callers enqueue (path, text) and return immediately
+# instead of blocking the orchestrator on disk appends.
+_write_queue: "queue.Queue[Tuple[str, str]]" = queue.Queue(maxsize=1000)
+
+
+def _writer_loop() -> None:
+    while True:
+        path, text = _write_queue.get()
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(text)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Failed to write {path}: {e}")
+        finally:
+            _write_queue.task_done()
+
+
+_writer_thread = threading.Thread(target=_writer_loop, daemon=True)
+_writer_thread.start()
+
+
+def flush_session_writes() -> None:
+    """Block until all queued session writes have hit disk."""
+    _write_queue.join()
+
+
+atexit.register(flush_session_writes)
+
+# Precompiled summary template: missing keys fall back to 'N/A' through the
+# defaultdict, so no per-field .get(..., 'N/A') calls are needed per write.
+_SUMMARY_TEMPLATE = """## Session Summary - {timestamp}
 
 ### Context Analysis
-- Project Phase: {context.get('development_phase', 'N/A')}
-- Complexity Level: {context.get('complexity_level', 'N/A')}
-- Error Rate: {metrics.get('error_rate', 'N/A')}
-- Technical Debt: {context.get('technical_debt', 'N/A')}
+- Project Phase: {development_phase}
+- Complexity Level: {complexity_level}
+- Error Rate: {error_rate}
+- Technical Debt: {technical_debt}
 
 ### Adaptive Decisions
-- Feature Count: {accomplishments.get('feature_count', 'N/A')}
-- Priority Focus: {accomplishments.get('priority_focus', 'N/A')}
-- Quality Gates: {accomplishments.get('quality_gates', 'N/A')}
+- Feature Count: {feature_count}
+- Priority Focus: {priority_focus}
+- Quality Gates: {quality_gates}
 
 ### Accomplishments
-- Errors Resolved: {accomplishments.get('errors_resolved', 'N/A')}
-- Features Implemented: {accomplishments.get('features_implemented', 'N/A')}
-- Refactoring Completed: {accomplishments.get('refactoring_completed', 'N/A')}
-- Tests Added: {accomplishments.get('tests_added', 'N/A')}
+- Errors Resolved: {errors_resolved}
+- Features Implemented: {features_implemented}
+- Refactoring Completed: {refactoring_completed}
+- Tests Added: {tests_added}
 
 ### Learning Outcomes
-- New Error Patterns: {learning.get('new_error_patterns', 'N/A')}
-- Performance Improvements: {learning.get('performance_improvements', 'N/A')}
-- Code Quality Enhancements: {learning.get('code_quality_enhancements', 'N/A')}
-- User Experience Gains: {learning.get('user_experience_gains', 'N/A')}
+- New Error Patterns: {new_error_patterns}
+- Performance Improvements: {performance_improvements}
+- Code Quality Enhancements: {code_quality_enhancements}
+- User Experience Gains: {user_experience_gains}
 
 ### Next Session Preparation
-- Priority Tasks: {learning.get('priority_tasks', 'N/A')}
-- Technical Debt Items: {learning.get('technical_debt_items', 'N/A')}
-- Performance Targets: {learning.get('performance_targets', 'N/A')}
-- Learning Focus: {learning.get('learning_focus', 'N/A')}
+- Priority Tasks: {priority_tasks}
+- Technical Debt Items: {technical_debt_items}
+- Performance Targets: {performance_targets}
+- Learning Focus: {learning_focus}
 
 ### Metrics
-- Session Duration: {metrics.get('session_duration', 'N/A')}
-- Feature Velocity: {metrics.get('feature_velocity', 'N/A')}
-- Error Resolution Rate: {metrics.get('error_resolution_rate', 'N/A')}
-- Code Quality Score: {metrics.get('code_quality_score', 'N/A')}
-- User Satisfaction: {metrics.get('user_satisfaction', 'N/A')}
+- Session Duration: {session_duration}
+- Feature Velocity: {feature_velocity}
+- Error Resolution Rate: {error_resolution_rate}
+- Code Quality Score: {code_quality_score}
+- User Satisfaction: {user_satisfaction}
 """
+
+def write_session_summary(context: Dict[str, Any], accomplishments: Dict[str, Any], metrics: Dict[str, Any], learning: Dict[str, Any], logger: Optional[logging.Logger] = None) -> None:
+    merged: Dict[str, Any] = {**context, **accomplishments, **learning, **metrics,
+                              'timestamp': datetime.now().isoformat()}
+    summary = _SUMMARY_TEMPLATE.format_map(defaultdict(lambda: 'N/A', merged))
     try:
-        with open("session_summary.log", "a", encoding="utf-8") as f:
-            f.write(summary + "\n\n")
+        _write_queue.put(("session_summary.log", summary + "\n\n"))
         if logger:
             logger.info("Session summary written successfully.")
     except Exception as e:
@@ -58,7 +103,6 @@ def write_session_summary(context: Dict[str, Any], accomplishments: Dict[str, An
 
 def log_session_event(event: str, details: Optional[Dict[str, Any]] = None, logger: Optional[logging.Logger] = None) -> None:
     timestamp = datetime.now().isoformat()
-    with open('session_log.txt', 'a', encoding='utf-8') as f:
-        f.write(f"[{timestamp}] {event}: {json.dumps(details or {})}\n")
+    _write_queue.put(('session_log.txt', f"[{timestamp}] {event}: {_dumps(details or {})}\n"))
     if logger:
         logger.info(f"Session event logged: {event}")
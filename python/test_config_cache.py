@@ -0,0 +1,17 @@
+"""
+test_config_cache.py - Unit tests for config_cache.py
+"""
+import unittest
+from config_cache import get_config
+
+class TestConfigCache(unittest.TestCase):
+    def test_get_config_returns_parsed_dict(self):
+        config = get_config()
+        self.assertIsInstance(config, dict)
+
+    def test_repeat_calls_hit_the_cache(self):
+        # Same mtime -> same parsed object, no re-read
+        self.assertIs(get_config(), get_config())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 """
 test_integration.py - Integration test for end-to-end workflow execution
 """
+import copy
 import unittest
 import os
 import sys
@@ -11,23 +12,25 @@ from workflow import HybridWorkflow
 from qa import run_quality_assurance
 
 class TestIntegrationWorkflow(unittest.TestCase):
-    def setUp(self):
-        self.context: Dict[str, Any] = {
+    # Built once per class; the single test hands the workflow its own copies
+    @classmethod
+    def setUpClass(cls):
+        cls.context: Dict[str, Any] = {
             'project_complexity': 'intermediate',
             'development_phase': 'implementation',
             'error_rate': 0.05,
             'technical_debt': 0.2
         }
-        self.tasks: List[Dict[str, Any]] = [
+        cls.tasks: List[Dict[str, Any]] = [
             {'name': 'Integration feature', 'importance': 2, 'urgency': 2, 'introduces_new_pattern': False}
         ]
-        self.error_patterns: Dict[str, Any] = {
+        cls.error_patterns: Dict[str, Any] = {
             'syntax_errors': {},
             'logic_errors': {}
         }
 
     def test_full_workflow_and_qa(self):
-        workflow = HybridWorkflow(self.context, self.tasks, self.error_patterns)
+        workflow = HybridWorkflow(copy.deepcopy(self.context), copy.deepcopy(self.tasks), self.error_patterns)
         log = workflow.run_full_workflow()
         self.assertIn('Session initialized with context analysis.', log)
         self.assertIn('Final optimization and learning logged.', log)
@@ -3,28 +3,33 @@ test_session.py - Unit tests for session.py
 """
 import unittest
 import os
-from session import write_session_summary, log_session_event
+from session import write_session_summary, log_session_event, flush_session_writes
 from typing import Any, Dict
 
 class TestSession(unittest.TestCase):
-    def setUp(self):
-        self.context: Dict[str, Any] = {
+    # Read-only fixtures: session writers never mutate their inputs, so one
+    # copy per class is safe
+    @classmethod
+    def setUpClass(cls):
+        cls.context: Dict[str, Any] = {
             'development_phase': 'testing',
             'complexity_level': 'simple',
             'technical_debt': 0.1
         }
-        self.accomplishments: Dict[str, Any] = {'feature_count': 1}
-        self.metrics: Dict[str, Any] = {'error_rate': 0.0}
-        self.learning: Dict[str, Any] = {'new_error_patterns': []}
-        self.session_file = 'test_session_summary.log'
-        self.log_file = 'test_session_log.txt'
+        cls.accomplishments: Dict[str, Any] = {'feature_count': 1}
+        cls.metrics: Dict[str, Any] = {'error_rate': 0.0}
+        cls.learning: Dict[str, Any] = {'new_error_patterns': []}
+        cls.session_file = 'test_session_summary.log'
+        cls.log_file = 'test_session_log.txt'
 
     def test_write_session_summary(self):
         write_session_summary(self.context, self.accomplishments, self.metrics, self.learning)
+        flush_session_writes()
         self.assertTrue(os.path.exists('session_summary.log'))
 
     def test_log_session_event(self):
         log_session_event('Test Event', {'foo': 'bar'})
+        flush_session_writes()
         self.assertTrue(os.path.exists('session_log.txt'))
 
 if __name__ == "__main__":
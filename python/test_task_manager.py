@@ -1,17 +1,21 @@
 """
 test_task_manager.py - Unit tests for task_manager.py
 """
+import copy
 import unittest
-from task_manager import TaskManager, TaskManagerModule
+import task_manager
+from task_manager import TaskManager, TaskManagerModule, calculate_task_priority
 from typing import Any, Dict, List
 
 class TestTaskManager(unittest.TestCase):
-    def setUp(self):
-        self.context: Dict[str, Any] = {
+    # Built once per class: tests that mutate tasks take a deepcopy
+    @classmethod
+    def setUpClass(cls):
+        cls.context: Dict[str, Any] = {
             'project_complexity': 'intermediate',
             'technical_debt': 0.2
         }
-        self.tasks: List[Dict[str, Any]] = [
+        cls.tasks: List[Dict[str, Any]] = [
             {'name': 'A', 'importance': 2, 'urgency': 2, 'introduces_new_pattern': False},
             {'name': 'B', 'importance': 3, 'urgency': 1, 'introduces_new_pattern': True}
         ]
@@ -23,13 +27,58 @@ class TestTaskManager(unittest.TestCase):
         self.assertTrue(prioritized[0]['name'] in ['A', 'B'])
 
     def test_execute_tasks(self):
-        tm = TaskManager(self.tasks, self.context)
+        tm = TaskManager(copy.deepcopy(self.tasks), self.context)
         executed = tm.execute_tasks()
         for task in executed:
             self.assertTrue(task['executed'])
 
+    def test_calculate_task_priority_reads_dict_fields(self):
+        # intermediate complexity -> factor 1.0; debt 0.2 -> penalty 0.98
+        self.assertAlmostEqual(calculate_task_priority(self.tasks[0], self.context), 2 * 2 * 0.98)
+        self.assertAlmostEqual(calculate_task_priority(self.tasks[1], self.context), 3 * 1 * 0.98 * 1.3)
+
+    def test_prioritize_tasks_orders_by_priority(self):
+        # A scores 3.92, B scores 3.822 -> A must come first
+        tm = TaskManager(self.tasks, self.context)
+        self.assertEqual([t['name'] for t in tm.prioritize_tasks()], ['A', 'B'])
+
+    def test_prioritize_tasks_top_k_matches_full_sort(self):
+        tasks = [{'name': str(i), 'importance': i % 5 + 1, 'urgency': (i * 3) % 7 + 1,
+                  'introduces_new_pattern': i % 2 == 0} for i in range(20)]
+        tm = TaskManager(tasks, self.context)
+        full = [t['name'] for t in tm.prioritize_tasks()]
+        for k in (1, 3, 9, 15, 25):
+            self.assertEqual([t['name'] for t in tm.prioritize_tasks(k=k)], full[:k])
+
+    def test_prioritize_module_top_k_matches_full_sort(self):
+        tasks = [{'name': str(i), 'importance': i % 4 + 1, 'urgency': (i * 5) % 6 + 1,
+                  'introduces_new_pattern': i % 3 == 0} for i in range(15)]
+        tmm = TaskManagerModule(tasks, self.context)
+        full = [t['name'] for t in tmm.prioritize()]
+        for k in (1, 4, 12):
+            self.assertEqual([t['name'] for t in tmm.prioritize(k=k)], full[:k])
+
+    def test_highest_k_and_lowest_k(self):
+        # Distinct priorities so the expected order is unambiguous
+        tasks = [{'name': str(i), 'importance': i + 1, 'urgency': 1,
+                  'introduces_new_pattern': False} for i in range(10)]
+        tm = TaskManager(tasks, self.context)
+        full = [t['name'] for t in tm.prioritize_tasks()]
+        for k in (2, 8):  # either side of the heap/sort crossover
+            self.assertEqual([t['name'] for t in tm.highest_k(k)], full[:k])
+            self.assertEqual([t['name'] for t in tm.lowest_k(k)], full[::-1][:k])
+
+    @unittest.skipIf(task_manager.np is None, "numpy not installed")
+    def test_numpy_path_matches_scalar_order(self):
+        n = task_manager._VECTORIZE_MIN_TASKS + 50
+        tasks = [{'name': str(i), 'importance': i + 1, 'urgency': 1,
+                  'introduces_new_pattern': False} for i in range(n)]
+        tm = TaskManager(tasks, self.context)
+        scalar = [t['name'] for t in TaskManagerModule(tasks, self.context).prioritize()]
+        self.assertEqual([t['name'] for t in tm.prioritize_tasks()], scalar)
+
     def test_task_manager_module(self):
-        tmm = TaskManagerModule(self.tasks, self.context)
+        tmm = TaskManagerModule(copy.deepcopy(self.tasks), self.context)
         prioritized = tmm.prioritize()
         self.assertEqual(len(prioritized), 2)
         executed = tmm.execute()
@@ -1,26 +1,34 @@
 """
 test_workflow.py - Unit tests for workflow.py and related modules
 """
+import copy
 import unittest
 from workflow import HybridWorkflow
 from typing import Any, Dict, List
 
 class TestHybridWorkflow(unittest.TestCase):
-    def setUp(self):
-        self.context: Dict[str, Any] = {
+    # Base fixtures built once per class; the workflow mutates context and
+    # tasks, so each test gets its own copies
+    @classmethod
+    def setUpClass(cls):
+        cls.base_context: Dict[str, Any] = {
             'project_complexity': 'intermediate',
             'development_phase': 'implementation',
             'error_rate': 0.05,
             'technical_debt': 0.2
         }
-        self.tasks: List[Dict[str, Any]] = [
+        cls.base_tasks: List[Dict[str, Any]] = [
             {'name': 'Test feature', 'importance': 2, 'urgency': 2, 'introduces_new_pattern': False}
         ]
-        self.error_patterns: Dict[str, Any] = {
+        cls.error_patterns: Dict[str, Any] = {
             'syntax_errors': {},
             'logic_errors': {}
         }
-        self.workflow = HybridWorkflow(self.context, self.tasks, self.error_patterns)
+
+    def setUp(self):
+        self.workflow = HybridWorkflow(copy.deepcopy(self.base_context),
+                                       copy.deepcopy(self.base_tasks),
+                                       self.error_patterns)
 
     def test_workflow_phases(self):
         log = self.workflow.run_full_workflow()
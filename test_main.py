@@ -0,0 +1,65 @@
+"""
+test_main.py - Unit tests for the pure text helpers in main.py
+GUI paths are not exercised here; these cover the fused/streaming helpers
+against their multi-pass equivalents.
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+try:
+    import main
+except Exception:  # chardet/tkinter may be absent in minimal environments
+    main = None
+
+TEXTS = [
+    "",
+    "one",
+    "  a \n\tb\t\nc",
+    "a\r\nb\rc\n",
+    " \n \n ",
+    "  a \nb\n\n  a\n c\r\nb \n\n",
+    "dup\ndup\n dup \nother",
+]
+
+
+@unittest.skipIf(main is None, "main.py dependencies not installed")
+class TestTextHelpers(unittest.TestCase):
+    def test_process_text_pipeline_matches_multipass(self):
+        for text in TEXTS:
+            lines = main.trim_whitespace(main.split_lines(text))
+            expected = '\n'.join(main.remove_duplicates(main.remove_empty_lines(lines)))
+            self.assertEqual(main.process_text_pipeline(text), expected, repr(text))
+
+    def test_strip_split_lines_matches_split_then_strip(self):
+        for text in TEXTS:
+            normalized = text.replace('\r\n', '\n').replace('\r', '\n')
+            expected = [line.strip(' \t\f\v') for line in normalized.split('\n')]
+            self.assertEqual(main.strip_split_lines(text), expected, repr(text))
+
+    def test_iter_lines_matches_split(self):
+        # LF/CRLF endings; a bare '\r' is not a line break for iter_lines
+        for text in TEXTS:
+            expected = [ln[:-1] if ln.endswith('\r') else ln for ln in text.split('\n')]
+            self.assertEqual(list(main.iter_lines(text)), expected, repr(text))
+
+    def test_remove_duplicates_preserves_order(self):
+        self.assertEqual(main.remove_duplicates(['b', 'a', 'b', 'c', 'a']), ['b', 'a', 'c'])
+
+    def test_read_text_file_mmap_matches_plain_read(self):
+        content = "line one\nsecond line\n" * 500
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt',
+                                         delete=False) as f:
+            f.write(content)
+            path = f.name
+        try:
+            self.assertEqual(main.read_text_file_mmap(path), content)
+            self.assertEqual(main.read_text_file(path), content)
+        finally:
+            os.unlink(path)
+
+if __name__ == "__main__":
+    unittest.main()